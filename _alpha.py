@@ -1,32 +1,110 @@
-import os
-import json
+import time
+import asyncio
+import socket
+from urllib.parse import urlsplit
+import textwrap
+import hashlib
+import functools
+import operator
+import orjson
+from collections import OrderedDict
 import gradio as gr
 import requests
+import httpx
 import bleach
-from typing import Dict, Any, List
-from dotenv import load_dotenv
-from google import genai
-from google.genai import types
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Literal, Optional, AsyncIterator
+from pydantic import BaseModel, ValidationError, field_validator
 
 # --- Configuration and Setup ---
-load_dotenv()
-
-# Initialize Google GenAI client with error handling
-try:
-    client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
-except (ValueError, AssertionError) as e:
-    print(f"WARNING: Could not initialize Google GenAI Client. Google GenAI features will be disabled.")
-    print(f"Details: {e}")
-    client = None
-
-# Model constants
-GEMINI_FLASH = 'gemini-2.5-flash'
-GEMINI_PRO = 'gemini-2.5-pro'
-
-# LM Studio configuration
-DEFAULT_LM_STUDIO_HOST = "localhost:1234"
-LM_STUDIO_MODELS = ["local-model"]  # This will be populated dynamically if needed
-
+# Shared settings (and the .env load) live in config.py
+from config import (APP_HOST, APP_PORT, APP_TITLE, GEMINI_FLASH, GEMINI_PRO,
+                    DEFAULT_LM_STUDIO_HOST, GOOGLE_API_KEY, LLM_TEMPERATURE,
+                    CACHE_MAX_TEMPERATURE)
+
+# Google GenAI client is created on first use so LM Studio-only sessions never import the SDK
+client = None
+_client_initialized = False
+
+def _get_genai_client():
+    """Lazily import google.genai and initialize the client with error handling"""
+    global client, _client_initialized
+    if not _client_initialized:
+        _client_initialized = True
+        from google import genai
+        try:
+            client = genai.Client(api_key=GOOGLE_API_KEY)
+        except (ValueError, AssertionError) as e:
+            print(f"WARNING: Could not initialize Google GenAI Client. Google GenAI features will be disabled.")
+            print(f"Details: {e}")
+            client = None
+    return client
+
+# Number of analyses the server runs concurrently (LLM calls are I/O-bound)
+ANALYSIS_CONCURRENCY = 8
+
+# Shared HTTP session so LM Studio calls reuse keep-alive connections
+_LM_SESSION = requests.Session()
+_LM_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+_LM_SESSION.mount("http://", _LM_ADAPTER)
+_LM_SESSION.mount("https://", _LM_ADAPTER)
+
+# Shared async HTTP client for long-running analysis calls
+_ASYNC_HTTP = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=httpx.Timeout(120.0, connect=5.0)  # 2 minute timeout for local processing
+)
+
+# --- Response Cache ---
+# Near-deterministic calls (low temperature) are cached so re-submitting the
+# same plan with the same model skips the LLM round-trip entirely.
+_RESP_CACHE: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_RESP_CACHE_MAXSIZE = 256
+_RESP_CACHE_TTL = 3600  # Seconds
+
+def _response_cache_key(provider: str, model_choice: str, markdown_plan: str,
+                        lm_studio_host: str = DEFAULT_LM_STUDIO_HOST) -> str:
+    """Build the cache key for a provider/model/plan combination (and host, for LM Studio)"""
+    if provider == "LM Studio (Local)":
+        provider = f"{provider}|{lm_studio_host}"
+    return hashlib.sha256(f"{provider}|{model_choice}|{markdown_plan}".encode("utf-8")).hexdigest()
+
+def _get_cached_response(key: str) -> Optional[str]:
+    """Return a cached response text, or None if missing or expired"""
+    entry = _RESP_CACHE.get(key)
+    if entry is None:
+        return None
+    stored_at, response_text = entry
+    if time.monotonic() - stored_at > _RESP_CACHE_TTL:
+        del _RESP_CACHE[key]
+        return None
+    _RESP_CACHE.move_to_end(key)
+    return response_text
+
+# Single-flight: identical requests that arrive while a call is running await its
+# result instead of issuing their own LLM call (all on one event loop, so no lock)
+_INFLIGHT: Dict[str, "asyncio.Future[str]"] = {}
+
+def _mark_retrieved(future: "asyncio.Future[str]") -> None:
+    """Consume a failed result so asyncio does not warn when nobody was waiting"""
+    if not future.cancelled():
+        future.exception()
+
+def _store_cached_response(key: str, response_text: str) -> None:
+    """Store a response text, evicting the least recently used entry if full"""
+    if LLM_TEMPERATURE > CACHE_MAX_TEMPERATURE:
+        return
+    _RESP_CACHE[key] = (time.monotonic(), response_text)
+    _RESP_CACHE.move_to_end(key)
+    while len(_RESP_CACHE) > _RESP_CACHE_MAXSIZE:
+        _RESP_CACHE.popitem(last=False)
+
+@functools.lru_cache(maxsize=8)
 def get_lm_studio_base_url(host: str) -> str:
     """Construct the LM Studio base URL from host"""
     if not host.startswith("http"):
@@ -70,6 +148,47 @@ Provide your analysis in this exact JSON format:
 Be specific, practical, and focus on actionable recommendations. Consider real-world constraints and trade-offs.
 """
 
+# Prompt pieces that never change between requests
+_SYSTEM_MSG = {"role": "system", "content": ARCHITECT_SYSTEM_PROMPT}
+_USER_PROMPT_PREFIX = "Please analyze this architecture plan:\n\n"
+
+# Display order for improvement severities
+_SEVERITY_ORDER = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
+_BY_SEVERITY_RANK = operator.attrgetter("severity_rank")
+
+# --- Response Models ---
+# Parsed and validated in one pass by pydantic-core straight from the JSON text.
+# Unlisted keys in the LLM output are ignored.
+
+class Strength(BaseModel):
+    point: str
+    reason: str
+
+class Improvement(BaseModel):
+    area: str
+    concern: str
+    suggestion: str
+    severity: Literal["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+
+    @field_validator("severity", mode="before")
+    @classmethod
+    def _normalize_severity(cls, value: Any) -> Any:
+        # Local models do not always honour the schema's upper-case enum
+        return value.strip().upper() if isinstance(value, str) else value
+
+    @property
+    def severity_rank(self) -> int:
+        return _SEVERITY_ORDER[self.severity]
+
+class Analysis(BaseModel):
+    planSummary: str
+    strengths: List[Strength] = []
+    areasForImprovement: List[Improvement] = []
+    actionableKeyPoints: List[str] = []
+
+# Minimum seconds between partial UI updates while a response is streaming
+_STREAM_UPDATE_INTERVAL = 0.25
+
 # --- Security: Markdown Sanitization ---
 
 def sanitize_markdown_output(content: str) -> str:
@@ -121,154 +240,200 @@ def sanitize_markdown_output(content: str) -> str:
 
 # --- Helper Functions for Different Providers ---
 
-def call_gemini(markdown_plan: str, model_choice: str):
-    """Call Google Gemini API"""
-    if not client:
-        raise Exception("Google GenAI client not initialized. Please check your GOOGLE_API_KEY.")
-    
-    config = types.GenerateContentConfig(
-        temperature=0.2,
+def _gemini_config():
+    """Build the Gemini generation config (imports the SDK types lazily)"""
+    from google.genai import types
+    return types.GenerateContentConfig(
+        temperature=LLM_TEMPERATURE,
         response_mime_type="application/json",
         system_instruction=ARCHITECT_SYSTEM_PROMPT
     )
+
+# Static part of every LM Studio request: JSON output constrained to the analysis schema
+_LM_STUDIO_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "architecture_analysis",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "summaryOfReviewerObservations": {
+                    "type": "string",
+                    "description": "A concise executive summary of the overall architectural strengths and key areas for focus"
+                },
+                "planSummary": {
+                    "type": "string", 
+                    "description": "Brief summary of what the system does as understood by Archimedes"
+                },
+                "strengths": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "dimension": {"type": "string"},
+                            "point": {"type": "string"},
+                            "reason": {"type": "string"}
+                        },
+                        "required": ["dimension", "point", "reason"]
+                    }
+                },
+                "areasForImprovement": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "area": {"type": "string"},
+                            "concern": {"type": "string"},
+                            "suggestion": {"type": "string"},
+                            "severity": {"type": "string", "enum": ["CRITICAL", "HIGH", "MEDIUM", "LOW"]},
+                            "impact": {"type": "string"},
+                            "tradeOffsConsidered": {"type": "string"}
+                        },
+                        "required": ["area", "concern", "suggestion", "severity"]
+                    }
+                },
+                "strategicRecommendations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "recommendation": {"type": "string"},
+                            "rationale": {"type": "string"},
+                            "potentialImplications": {"type": "string"}
+                        },
+                        "required": ["recommendation", "rationale"]
+                    }
+                },
+                "nextStepsAndConsiderations": {
+                    "type": "array",
+                    "items": {"type": "string"}
+                }
+            },
+            "required": ["summaryOfReviewerObservations", "planSummary", "strengths", "areasForImprovement", "strategicRecommendations", "nextStepsAndConsiderations"]
+        },
+        "strict": True
+    }
+}
+
+def _encode_lm_studio_payload(markdown_plan: str, model_choice: str, stream: bool) -> bytes:
+    """Build and serialize the OpenAI-compatible chat completion payload for LM Studio"""
+    # Format the prompt for chat completion
+    messages = [
+        _SYSTEM_MSG,
+        {"role": "user", "content": _USER_PROMPT_PREFIX + markdown_plan}
+    ]
+    
+    payload: Dict[str, Any] = {
+        "model": model_choice,
+        "messages": messages,
+        "temperature": LLM_TEMPERATURE,
+        "stream": stream,
+        "response_format": _LM_STUDIO_RESPONSE_FORMAT
+    }
+    return orjson.dumps(payload)
+
+async def call_gemini_stream(markdown_plan: str, model_choice: str) -> AsyncIterator[str]:
+    """Call Google Gemini API, yielding response text chunks as they are generated"""
+    genai_client = _get_genai_client()
+    if not genai_client:
+        raise Exception("Google GenAI client not initialized. Please check your GOOGLE_API_KEY.")
     
-    full_prompt = f"Please analyze this architecture plan:\n\n{markdown_plan}"
+    full_prompt = _USER_PROMPT_PREFIX + markdown_plan
     
-    response = client.models.generate_content(
+    stream = await genai_client.aio.models.generate_content_stream(
         model=f'models/{model_choice}',
         contents=full_prompt,
-        config=config
+        config=_gemini_config()
     )
     
-    return response.text or ""
+    async for chunk in stream:
+        if chunk.text:
+            yield chunk.text
 
-def call_lm_studio(markdown_plan: str, model_choice: str, host: str = DEFAULT_LM_STUDIO_HOST):
-    """Call LM Studio local API using OpenAI-compatible format"""
+async def call_lm_studio_stream(markdown_plan: str, model_choice: str, host: str = DEFAULT_LM_STUDIO_HOST) -> AsyncIterator[str]:
+    """Call LM Studio with streaming enabled, yielding content deltas from the SSE stream"""
     try:
         lm_studio_base_url = get_lm_studio_base_url(host)
         
-        # LM Studio uses OpenAI-compatible API format
         headers = {
             "Content-Type": "application/json"
         }
         
-        # Format the prompt for chat completion
-        messages = [
-            {"role": "system", "content": ARCHITECT_SYSTEM_PROMPT},
-            {"role": "user", "content": f"Please analyze this architecture plan:\n\n{markdown_plan}"}
-        ]
-        
-        payload: Dict[str, Any] = {
-            "model": model_choice,
-            "messages": messages,
-            "temperature": 0.2,
-            "stream": False,
-            "response_format": {
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "architecture_analysis",
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "summaryOfReviewerObservations": {
-                                "type": "string",
-                                "description": "A concise executive summary of the overall architectural strengths and key areas for focus"
-                            },
-                            "planSummary": {
-                                "type": "string", 
-                                "description": "Brief summary of what the system does as understood by Archimedes"
-                            },
-                            "strengths": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "dimension": {"type": "string"},
-                                        "point": {"type": "string"},
-                                        "reason": {"type": "string"}
-                                    },
-                                    "required": ["dimension", "point", "reason"]
-                                }
-                            },
-                            "areasForImprovement": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "area": {"type": "string"},
-                                        "concern": {"type": "string"},
-                                        "suggestion": {"type": "string"},
-                                        "severity": {"type": "string", "enum": ["CRITICAL", "HIGH", "MEDIUM", "LOW"]},
-                                        "impact": {"type": "string"},
-                                        "tradeOffsConsidered": {"type": "string"}
-                                    },
-                                    "required": ["area", "concern", "suggestion", "severity"]
-                                }
-                            },
-                            "strategicRecommendations": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "recommendation": {"type": "string"},
-                                        "rationale": {"type": "string"},
-                                        "potentialImplications": {"type": "string"}
-                                    },
-                                    "required": ["recommendation", "rationale"]
-                                }
-                            },
-                            "nextStepsAndConsiderations": {
-                                "type": "array",
-                                "items": {"type": "string"}
-                            }
-                        },
-                        "required": ["summaryOfReviewerObservations", "planSummary", "strengths", "areasForImprovement", "strategicRecommendations", "nextStepsAndConsiderations"]
-                    },
-                    "strict": True
-                }
-            }  # Request JSON format with schema
-        }
-        
-        response = requests.post(
+        async with _ASYNC_HTTP.stream(
+            "POST",
             f"{lm_studio_base_url}/chat/completions",
             headers=headers,
-            json=payload,
-            timeout=120  # 2 minute timeout for local processing
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            return result["choices"][0]["message"]["content"]
-        else:
-            raise Exception(f"LM Studio API error: {response.status_code} - {response.text}")
+            content=_encode_lm_studio_payload(markdown_plan, model_choice, stream=True)
+        ) as response:
+            if response.status_code != 200:
+                body = await response.aread()
+                raise Exception(f"LM Studio API error: {response.status_code} - {body.decode('utf-8', errors='replace')}")
             
-    except requests.exceptions.ConnectionError:
+            # Server-sent events: each event line looks like "data: {...}"
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                delta = orjson.loads(data)["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    yield delta
+            
+    except httpx.ConnectError:
         raise Exception(f"Cannot connect to LM Studio at {host}. Please ensure LM Studio is running.")
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         raise Exception("LM Studio request timed out. The model might be too slow or the request too complex.")
     except Exception as e:
         raise Exception(f"LM Studio API error: {str(e)}")
 
+# The loaded model list changes rarely, so successful listings are reused for a short while
+_MODELS_CACHE: Dict[str, tuple[float, List[str]]] = {}
+_MODELS_CACHE_TTL = 30  # Seconds
+
+def clear_lm_studio_models_cache() -> None:
+    """Forget cached model listings so the next lookup hits LM Studio"""
+    _MODELS_CACHE.clear()
+
 def get_available_lm_studio_models(host: str = DEFAULT_LM_STUDIO_HOST) -> List[str]:
     """Get available models from LM Studio"""
+    cached = _MODELS_CACHE.get(host)
+    if cached is not None and time.monotonic() - cached[0] < _MODELS_CACHE_TTL:
+        return cached[1]
+    
     try:
         lm_studio_base_url = get_lm_studio_base_url(host)
-        response = requests.get(f"{lm_studio_base_url}/models", timeout=5)
+        response = _LM_SESSION.get(f"{lm_studio_base_url}/models", timeout=1.5)  # Local endpoint answers in well under a second
         if response.status_code == 200:
-            models = response.json()
-            return [model["id"] for model in models.get("data", [])]
+            models = orjson.loads(response.content)
+            model_ids = [model["id"] for model in models.get("data", [])]
+            _MODELS_CACHE[host] = (time.monotonic(), model_ids)
+            return model_ids
         else:
             return ["local-model"]  # Fallback
     except:
         return ["local-model"]  # Fallback if LM Studio is not running
 
+def _tcp_alive(base_url: str, timeout: float = 1.0) -> bool:
+    """Cheap reachability probe: can we open a TCP connection to the LM Studio port?"""
+    parts = urlsplit(base_url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    try:
+        socket.create_connection((parts.hostname, port), timeout=timeout).close()
+        return True
+    except (OSError, ValueError):
+        return False
+
 def test_lm_studio_connection(host: str) -> tuple[bool, str]:
     """Test connection to LM Studio and return status"""
     try:
         lm_studio_base_url = get_lm_studio_base_url(host)
-        response = requests.get(f"{lm_studio_base_url}/models", timeout=5)
+        # Fail fast on an unreachable host before paying for the HTTP request
+        if not _tcp_alive(lm_studio_base_url):
+            return False, f"❌ Cannot connect to LM Studio at {host}. Please ensure LM Studio is running."
+        response = _LM_SESSION.get(f"{lm_studio_base_url}/models", timeout=5)
         if response.status_code == 200:
-            models = response.json()
+            models = orjson.loads(response.content)
             model_count = len(models.get("data", []))
             return True, f"✅ Connected successfully. Found {model_count} models."
         else:
@@ -282,71 +447,117 @@ def test_lm_studio_connection(host: str) -> tuple[bool, str]:
 
 # --- The Backend Logic  ---
 
-def analyze_architecture(markdown_plan: str, model_choice: str, provider: str, lm_studio_host: str = DEFAULT_LM_STUDIO_HOST):
+async def analyze_architecture(markdown_plan: str, model_choice: str, provider: str, lm_studio_host: str = DEFAULT_LM_STUDIO_HOST):
     """
     Analyzes the architecture plan using either Google GenAI or LM Studio
     based on the selected provider.
     """
     if not markdown_plan.strip():
         gr.Warning("Please enter an architecture plan to analyze.")
-        return "Please enter an architecture plan to analyze."
+        yield "Please enter an architecture plan to analyze."
+        return
 
     # Show a loading message in the UI immediately
     yield sanitize_markdown_output(f"🤖 Analyzing your plan with {model_choice} via {provider}...")
 
     response_text = ""  # Initialize to avoid unbound variable issues
+    generated = False  # Whether this call produced response_text itself (not cache or follower)
+    cache_key = _response_cache_key(provider, model_choice, markdown_plan, lm_studio_host)
     
     try:
-        # Call the appropriate provider
-        if provider == "Google GenAI":
-            response_text = call_gemini(markdown_plan, model_choice)
-        elif provider == "LM Studio (Local)":
-            response_text = call_lm_studio(markdown_plan, model_choice, lm_studio_host)
+        # Call the appropriate provider (unless we already have this exact response cached)
+        cached_response = _get_cached_response(cache_key)
+        inflight = _INFLIGHT.get(cache_key)
+        if cached_response is not None:
+            response_text = cached_response
+        elif inflight is not None:
+            # Someone else is already generating this exact analysis; share their result
+            response_text = await asyncio.shield(inflight)
         else:
-            error_msg = f"**Error:** Unknown provider: {provider}"
-            yield sanitize_markdown_output(error_msg)
-            return
+            if provider == "Google GenAI":
+                stream = call_gemini_stream(markdown_plan, model_choice)
+            elif provider == "LM Studio (Local)":
+                stream = call_lm_studio_stream(markdown_plan, model_choice, lm_studio_host)
+            else:
+                error_msg = f"**Error:** Unknown provider: {provider}"
+                yield sanitize_markdown_output(error_msg)
+                return
+            
+            future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+            future.add_done_callback(_mark_retrieved)
+            _INFLIGHT[cache_key] = future
+            try:
+                # Report progress as a character count; the JSON is only joined and parsed once complete
+                chunks: List[str] = []
+                received = 0
+                last_update = time.monotonic()
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    received += len(chunk)
+                    now = time.monotonic()
+                    if now - last_update >= _STREAM_UPDATE_INTERVAL:
+                        last_update = now
+                        yield sanitize_markdown_output(f"🤖 Generating analysis with {model_choice} via {provider}... ({received:,} characters received)")
+                response_text = "".join(chunks)
+                generated = True
+                future.set_result(response_text)
+            except Exception as e:
+                future.set_exception(e)
+                raise
+            finally:
+                if not future.done():
+                    # Generator was closed mid-stream; fail followers with an ordinary
+                    # error (not CancelledError) so their error handling still runs
+                    future.set_exception(RuntimeError("The shared analysis request was cancelled. Please try again."))
+                _INFLIGHT.pop(cache_key, None)
         
         if not response_text:
             error_msg = "**Error:** Empty response from AI model. Please try again."
             yield sanitize_markdown_output(error_msg)
             return
             
-        analysis_json = json.loads(response_text)
-
-        # --- Format the JSON into beautiful markdown for display ---
-        output_md = f"## 📝 Architecture Analysis (via {model_choice})\n\n"
-        output_md += f"### 📜 Plan Summary\n{analysis_json['planSummary']}\n\n"
+        analysis = Analysis.model_validate_json(response_text)
+        if generated:
+            # Only fresh responses are stored, so a cache hit never extends its own TTL
+            _store_cached_response(cache_key, response_text)
+
+        # --- Format the analysis into beautiful markdown for display ---
+        parts: List[str] = [
+            f"## 📝 Architecture Analysis (via {model_choice})\n\n",
+            f"### 📜 Plan Summary\n{analysis.planSummary}\n\n",
+        ]
         
-        if analysis_json.get('strengths'):
-            output_md += f"### ✅ Strengths\n"
-            for item in analysis_json['strengths']:
-                output_md += f"- **{item['point']}:** {item['reason']}\n"
+        if analysis.strengths:
+            parts.append("### ✅ Strengths\n")
+            for item in analysis.strengths:
+                parts.append(f"- **{item.point}:** {item.reason}\n")
         
-        if analysis_json.get('areasForImprovement'):
-            output_md += f"\n### 🔍 Areas for Improvement\n"
-            # Sort by severity to show critical items first
-            severity_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
-            sorted_improvements = sorted(analysis_json['areasForImprovement'], key=lambda x: severity_order.get(x['severity'], 99))
+        if analysis.areasForImprovement:
+            parts.append("\n### 🔍 Areas for Improvement\n")
+            # Sort in place by severity rank to show critical items first
+            improvements = analysis.areasForImprovement
+            improvements.sort(key=_BY_SEVERITY_RANK)
             
-            for item in sorted_improvements:
-                output_md += f"- **[{item['severity']}] {item['area']}**\n"
-                output_md += f"  - **Concern:** {item['concern']}\n"
-                output_md += f"  - **Suggestion:** {item['suggestion']}\n"
+            for item in improvements:
+                parts.append(f"- **[{item.severity}] {item.area}**\n")
+                parts.append(f"  - **Concern:** {item.concern}\n")
+                parts.append(f"  - **Suggestion:** {item.suggestion}\n")
+        
+        if analysis.actionableKeyPoints:
+            parts.append("\n### 🚀 Actionable Key Points\n")
+            for point in analysis.actionableKeyPoints:
+                parts.append(f"- {point}\n")
         
-        if analysis_json.get('actionableKeyPoints'):
-            output_md += f"\n### 🚀 Actionable Key Points\n"
-            for point in analysis_json['actionableKeyPoints']:
-                output_md += f"- {point}\n"
+        output_md = "".join(parts)
         
         # Sanitize the output Markdown to prevent XSS
         safe_output_md = sanitize_markdown_output(output_md)
         
         yield safe_output_md
 
-    except json.JSONDecodeError:
+    except ValidationError:
         gr.Error("The AI returned an invalid JSON response. This can happen with complex inputs.")
-        error_msg = f"**Error:** The AI response could not be parsed as JSON. Please try a slightly different input or a more powerful model.\n\n**Raw Response:**\n```\n{response_text}\n```"
+        error_msg = f"**Error:** The AI response could not be parsed as a valid analysis. Please try a slightly different input or a more powerful model.\n\n**Raw Response:**\n```\n{response_text}\n```"
         yield sanitize_markdown_output(error_msg)
     except Exception as e:
         gr.Error(f"An unexpected error occurred: {str(e)}")
@@ -354,7 +565,8 @@ def analyze_architecture(markdown_plan: str, model_choice: str, provider: str, l
         yield sanitize_markdown_output(error_msg)
 
 # --- 3. Example Plan for the UI ---
-EXAMPLE_PLAN = """
+# Dedented and stripped once at import so no stray whitespace is sent to the LLM
+EXAMPLE_PLAN = textwrap.dedent("""
 # Project: Real-time User Analytics Dashboard
 
 ## 1. Overview
@@ -372,7 +584,7 @@ This system will track user clicks on a website and display them on a real-time
 2. React app sends a request to `POST /event`.
 3. The Node.js API writes the event to the PostgreSQL database.
 4. The API also pushes the event over a websocket to all connected dashboard clients.
-"""
+""").strip()
 
 # --- 4. Gradio UI ---
 # Custom CSS for full-page layout
@@ -447,7 +659,7 @@ footer {
 }
 """
 
-with gr.Blocks(css=custom_css, title="VelocityAI - A Systems Architect Toolset") as demo:
+with gr.Blocks(css=custom_css, title=APP_TITLE) as demo:
     with gr.Column(elem_classes="main-header"):
         gr.Markdown("# 🚀 VelocityAI - A Systems Architect Toolset")
         gr.Markdown("Enter your system architecture plan in Markdown. The AI will analyze it for scalability, reliability, security, and more.")
@@ -548,6 +760,11 @@ with gr.Blocks(css=custom_css, title="VelocityAI - A Systems Architect Toolset")
                         info="No models found. Please check your LM Studio connection."
                     )
             
+            def force_refresh_models_for_host(host: str):
+                """Refresh button handler: bypass the cached model listing"""
+                clear_lm_studio_models_cache()
+                return refresh_models_for_host(host)
+            
             def update_models_on_host_change(provider: str, host: str):
                 """Update models when host changes for LM Studio"""
                 if provider == "LM Studio (Local)":
@@ -575,13 +792,14 @@ with gr.Blocks(css=custom_css, title="VelocityAI - A Systems Architect Toolset")
             )
             
             refresh_models_btn.click(
-                fn=refresh_models_for_host,
+                fn=force_refresh_models_for_host,
                 inputs=lm_studio_host,
                 outputs=model_selector
             )
             
-            # Auto-refresh models when host changes
-            lm_studio_host.change(
+            # Auto-refresh models once the host has been entered (not on every keystroke)
+            gr.on(
+                triggers=[lm_studio_host.submit, lm_studio_host.blur],
                 fn=update_models_on_host_change,
                 inputs=[provider_selector, lm_studio_host],
                 outputs=model_selector
@@ -611,13 +829,17 @@ with gr.Blocks(css=custom_css, title="VelocityAI - A Systems Architect Toolset")
     submit_button.click(
         fn=analyze_architecture,
         inputs=[input_markdown, model_selector, provider_selector, lm_studio_host],
-        outputs=output_analysis
+        outputs=output_analysis,
+        concurrency_limit=ANALYSIS_CONCURRENCY,
+        concurrency_id="llm"
     )
 
+demo.queue(default_concurrency_limit=ANALYSIS_CONCURRENCY, max_size=64)
+
 if __name__ == "__main__":
     demo.launch(
-        server_name="0.0.0.0",
-        server_port=7860,
+        server_name=APP_HOST,
+        server_port=APP_PORT,
         share=False,
         debug=True,
         show_error=True,
@@ -21,10 +21,24 @@ APP_TITLE = "VelocityAI - A Systems Architect Toolset"
 APP_PORT = 7860
 APP_HOST = "0.0.0.0"
 
+# Largest architecture plan accepted for analysis, in characters
+MAX_PLAN_CHARS = 256 * 1024
+
 # Google API configuration
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 
+# LLM sampling temperature (0 makes analyses fully deterministic)
+LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.2"))
+
+# Highest sampling temperature whose responses are cached and reused.
+# Defaults to the shipped LLM_TEMPERATURE, whose low sampling makes repeat
+# analyses near-identical; set CACHE_MAX_TEMPERATURE=0 to only cache
+# deterministic requests, or below 0 to disable response caching.
+CACHE_MAX_TEMPERATURE = float(os.getenv("CACHE_MAX_TEMPERATURE", "0.2"))
+
 # Export configuration
+# Set ENABLE_EXPORT=false to run without the export UI (and skip the export machinery entirely)
+ENABLE_EXPORT = os.getenv("ENABLE_EXPORT", "true").strip().lower() not in ("0", "false", "no")
 EXPORT_FORMATS = ["PDF", "HTML", "Markdown"]
 DEFAULT_EXPORT_FORMAT = "PDF"
 EXPORT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "exports")
@@ -2,104 +2,317 @@
 Core logic for architecture analysis including prompt engineering and response parsing.
 """
 
+import functools
+import hashlib
 import json
-from typing import Dict, Any
-
-# The specialized system prompt for our Architecture Reviewer
-ARCHITECT_SYSTEM_PROMPT = """You are **Archimedes**, the ultimate LLM Engineer Copilot, embodying a visionary Senior Principal Systems Architect with over 25 years of battle-tested, hands-on experience designing, deploying, and optimizing ultra-large-scale, highly distributed, and mission-critical systems across diverse industries (e.g., FinTech, SaaS, Healthcare, AI/ML Platforms).
-
-Your unique purpose is to serve as a **force multiplier and strategic mentor** for individuals who possess a *natural, high-velocity ability to conceptualize and design complex systems* but may not have formal systems architecture training. You will help them formalize their brilliant intuitive ideas, stress-test their designs, identify hidden complexities, and transform raw concepts into robust, production-ready blueprints.
-
-**Your Core Mission:**
-To collaboratively review system architecture plans, offering unparalleled depth of insight, proactive identification of potential pitfalls, and highly actionable, pragmatic recommendations, always considering real-world constraints, trade-offs, and Total Cost of Ownership (TCO).
-
-**Your Review Philosophy & Approach:**
-
-1.  **Empathetic & Guiding:** Understand that the user thinks rapidly and intuitively. Your feedback should be constructive, educational, and designed to augment their natural talent, not stifle it. You are a collaborator, not just a critic.
-2.  **Holistic & Systemic:** Look beyond individual components to the interactions, data flows, and emergent properties of the entire system. Consider the "why" behind design choices.
-3.  **Proactive & Anticipatory:** Foresee future challenges (growth, evolving requirements, technical debt) and common anti-patterns before they materialize.
-4.  **Pragmatic & Context-Aware:** Ground your advice in practical implementation, operational realities, and the user's stated goals, budget, team capabilities, and existing infrastructure.
-5.  **Pattern-Oriented:** Leverage and suggest well-established architectural patterns (e.g., microservices, event-driven, CQRS, data mesh) and caution against anti-patterns.
-6.  **Trade-off Minded:** Explicitly articulate the compromises inherent in design choices (e.g., consistency vs. availability, performance vs. cost, complexity vs. flexibility).
-
-**Review Dimensions (Deep Dive):**
-
-When analyzing an architecture plan, scrutinize it across these expanded, inter-connected dimensions:
-
-1.  **Scalability & Elasticity:**
-    *   *Question:* Can it gracefully handle 10x, 100x, 1000x growth in users, data volume, and transaction throughput without re-architecture?
-    *   *Consider:* Horizontal vs. Vertical scaling strategies, statelessness, data partitioning/sharding (and re-sharding), load balancing, connection pooling, cache effectiveness, concurrency models, auto-scaling triggers, and cold start implications (for serverless).
-2.  **Reliability & Resilience:**
-    *   *Question:* How does the system behave under failure conditions? What's the "blast radius" of a component failure?
-    *   *Consider:* Redundancy (active-active, active-passive, N+M), fault isolation (bulkheads, circuit breakers), graceful degradation, retry mechanisms, idempotency, backpressure, disaster recovery (RPO/RTO targets, multi-region/multi-AZ), chaos engineering potential, and failover/fallback strategies.
-3.  **Security Posture:**
-    *   *Question:* How robust is the system against common and advanced threats? Is data protected end-to-end?
-    *   *Consider:* Threat modeling (STRIDE), least privilege principles, strong authentication/authorization (OAuth, RBAC, ABAC), data encryption (at rest and in transit), secure API design (input validation, rate limiting), supply chain security (dependencies), vulnerability management, compliance (GDPR, HIPAA, SOC2), and secure secrets management.
-4.  **Performance & Latency Characteristics:**
-    *   *Question:* Will the system meet defined SLAs for response times and throughput under peak load?
-    *   *Consider:* Bottleneck identification (CPU, I/O, network, database locks), caching strategies (CDN, in-memory, distributed, invalidation), asynchronous processing, message queueing, efficient data access patterns, query optimization, resource contention, and network topology impacts.
-5.  **Maintainability & Evolvability:**
-    *   *Question:* How easy is it to understand, modify, extend, and debug the system over its lifespan? Can new features be added without major refactoring?
-    *   *Consider:* Modularity, loose coupling (via APIs, events), clear separation of concerns, API versioning strategy, documentation clarity, testing strategy (unit, integration, end-to-end), code quality, dependency management, and technical debt implications.
-6.  **Cost Efficiency & TCO (Total Cost of Ownership):**
-    *   *Question:* Is the design financially sustainable? Are resources optimally utilized to achieve the desired outcomes?
-    *   *Consider:* Cloud resource right-sizing, serverless vs. provisioned compute, storage tiers, data transfer costs, network egress, licensing fees, operational overhead (DevOps staffing, incident response), and the balance between upfront investment and long-term running costs.
-7.  **Observability & Debuggability:**
-    *   *Question:* How effectively can we monitor health, diagnose issues, and understand system behavior in production?
-    *   *Consider:* Comprehensive logging (structured logs, log aggregation), metrics collection (latency, error rates, resource utilization), distributed tracing, alerting strategy, dashboarding, health checks, runbook readiness, and the ease of root cause analysis during incidents.
-8.  **Operability & Deployment:**
-    *   *Question:* How smooth is the process of deploying, managing, patching, and operating the system day-to-day?
-    *   *Consider:* CI/CD pipelines, infrastructure as code (IaC), zero-downtime deployments, rollback strategies, configuration management, environmental consistency, and automation potential.
-9.  **Technology & Ecosystem Appropriateness:**
-    *   *Question:* Are the chosen technologies (databases, languages, frameworks, messaging systems) the *best fit* for the problem domain, considering scale, maturity, community support, and team expertise?
-    *   *Consider:* Vendor lock-in, open-source vs. commercial, integration complexity, data modeling choices, and the overall technology landscape.
-
-**Output Format (Exact JSON Structure):**
-
-```json
-{
-  "summaryOfReviewerObservations": "A concise (2-4 sentences) executive summary of the overall architectural strengths and key areas for focus, acknowledging the user's intuitive design approach.",
-  "planSummary": "Brief 2-3 sentence summary of what the system does as understood by Archimedes.",
-  "strengths": [
-    {
-      "dimension": "e.g., Scalability, Security, Maintainability",
-      "point": "Specific strength, e.g., 'Leverages stateless microservices for compute'",
-      "reason": "Why this is good, e.g., 'This design inherently supports horizontal scaling and improves resilience by isolating failures.'"
-    }
-  ],
-  "areasForImprovement": [
-    {
-      "area": "Specific architectural concern (e.g., Data Persistence, Messaging Layer, Authentication Flow)",
-      "concern": "What the exact problem or unaddressed risk is, e.g., 'Single point of failure in Kafka cluster if not multi-AZ.'",
-      "suggestion": "Specific, actionable, and pragmatic recommendation, e.g., 'Implement Kafka across multiple availability zones and configure replication factor > 1 for topics. Consider mirroring topics across regions for DR.'",
-      "severity": "CRITICAL|HIGH|MEDIUM|LOW",
-      "impact": "Brief explanation of the potential negative consequence if not addressed (e.g., 'System outage, data loss, security breach, high operational cost.')",
-      "tradeOffsConsidered": "Optional: Briefly mention any trade-offs associated with the suggestion (e.g., 'Increases infrastructure cost, adds complexity to deployment.')"
-    }
-  ],
-  "strategicRecommendations": [
-    {
-      "recommendation": "Broader, higher-level architectural shifts or strategic considerations that could fundamentally improve the system. E.g., 'Consider an event-driven architecture for better loose coupling and scalability.'",
-      "rationale": "Why this strategic direction is beneficial.",
-      "potentialImplications": "Briefly describe the effort or change required (e.g., 'Requires significant re-platforming and cultural shift.')."
+import math
+import operator
+import re
+import sys
+from collections import Counter, OrderedDict
+from pathlib import Path
+import jinja2
+import orjson
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+# The specialized system prompt for our Architecture Reviewer is assembled from
+# the Markdown modules in prompts/, so callers can send only the sections they need
+PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
+PROMPT_DIMENSIONS = (
+    "scalability", "reliability", "security", "performance", "maintainability",
+    "cost", "observability", "operability", "technology",
+)
+DEFAULT_PROMPT_MODULES = (
+    "persona",
+    "philosophy",
+    *(f"dimensions/{name}" for name in PROMPT_DIMENSIONS),
+    "output_format",
+    "directives",
+)
+_PROMPT_MODULE_NAME = re.compile(r"[a-z_]+(?:/[a-z_]+)?")
+
+@functools.lru_cache(maxsize=None)
+def _load_prompt_module(name: str) -> str:
+    """Read and intern a single prompt module."""
+    if not _PROMPT_MODULE_NAME.fullmatch(name):
+        raise ValueError(f"Unknown prompt module: {name}")
+    try:
+        text = (PROMPTS_DIR / f"{name}.md").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise ValueError(f"Unknown prompt module: {name}")
+    return sys.intern(text.rstrip("\n"))
+
+@functools.lru_cache(maxsize=32)
+def _build_system_prompt(modules: Tuple[str, ...]) -> str:
+    sections: List[str] = []
+    dimensions: List[str] = []
+    dimensions_at = -1
+    
+    for name in modules:
+        if name.startswith("dimensions/"):
+            if not dimensions:
+                dimensions_at = len(sections)
+                sections.append("")  # Filled in once all dimensions are known
+            dimensions.append(_load_prompt_module(name))
+        else:
+            sections.append(_load_prompt_module(name))
+    
+    if dimensions:
+        numbered = "\n".join(f"{i}.  {text}" for i, text in enumerate(dimensions, 1))
+        sections[dimensions_at] = f"{_load_prompt_module('dimensions')}\n\n{numbered}"
+    
+    return sys.intern("\n\n".join(sections) + "\n")
+
+def build_system_prompt(modules: Iterable[str] = DEFAULT_PROMPT_MODULES) -> str:
+    """
+    Assemble a system prompt from the given prompt modules.
+    
+    Review dimensions (``"dimensions/<name>"``) are grouped under a single
+    heading at the position of the first one and numbered in the order given.
+    
+    Args:
+        modules: Module names relative to ``prompts/``, without the ``.md`` suffix
+        
+    Returns:
+        The assembled, interned prompt text
+        
+    Raises:
+        ValueError: If a module does not exist
+    """
+    return _build_system_prompt(tuple(modules))
+
+@functools.cache
+def architect_system_prompt() -> str:
+    """Return the full system prompt, reading it from prompts/ on first use."""
+    return build_system_prompt()
+
+@functools.cache
+def architect_system_prompt_bytes() -> bytes:
+    """Return the UTF-8 encoding of the full system prompt."""
+    return architect_system_prompt().encode("utf-8")
+
+@functools.cache
+def architect_system_prompt_sha256() -> bytes:
+    """Return the SHA-256 digest of the full system prompt, a stable cache key for the system prefix."""
+    return hashlib.sha256(architect_system_prompt_bytes()).digest()
+
+EXAMPLE_PLAN_PATH = Path(__file__).resolve().parent / "data" / "example_plan.md"
+
+@functools.cache
+def example_plan() -> str:
+    """Return the example plan shown in the UI, reading it on first use."""
+    return EXAMPLE_PLAN_PATH.read_text(encoding="utf-8")
+
+# The large text constants are resolved lazily so importing this module does no file I/O
+_LAZY_CONSTANTS: Dict[str, Callable[[], Any]] = {
+    "ARCHITECT_SYSTEM_PROMPT": architect_system_prompt,
+    "ARCHITECT_SYSTEM_PROMPT_BYTES": architect_system_prompt_bytes,
+    "ARCHITECT_SYSTEM_PROMPT_SHA256": architect_system_prompt_sha256,
+    "EXAMPLE_PLAN": example_plan,
+}
+
+def __getattr__(name: str) -> Any:
+    try:
+        loader = _LAZY_CONSTANTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return loader()
+
+# Provider-specific delivery of the system prompt. The text is always sent
+# byte-identical so server-side prefix caching (Gemini implicit caching,
+# LM Studio's llama.cpp prompt cache) can reuse the already-processed prompt.
+@functools.cache
+def _system_prompt_blocks() -> Dict[str, Any]:
+    prompt = architect_system_prompt()
+    return {
+        "Google GenAI": prompt,  # Passed as system_instruction
+        "LM Studio (Local)": {"role": "system", "content": prompt},  # OpenAI-style chat message
     }
-  ],
-  "nextStepsAndConsiderations": [
-    "Specific, prioritized next steps for the user to take. E.g., '1. Conduct a detailed threat model for the authentication service.'",
-    "Further clarifying questions for the user if parts of the plan are ambiguous or require more detail to provide optimal feedback. E.g., 'What are the expected RPO/RTO targets for data recovery?'",
-    "Any additional advice or resources for deepening understanding."
-  ]
+
+def get_system_prompt_block(provider: str) -> Any:
+    """
+    Get the system prompt in the structure the given provider expects.
+    
+    Args:
+        provider: The provider name ("Google GenAI" or "LM Studio (Local)")
+        
+    Returns:
+        The prompt string for Google GenAI, or a system chat message for LM Studio
+        
+    Raises:
+        ValueError: If the provider is unknown
+    """
+    try:
+        return _system_prompt_blocks()[provider]
+    except KeyError:
+        raise ValueError(f"Unknown provider: {provider}")
+
+USER_PROMPT_PREFIX = "Please analyze this architecture plan:\n\n"
+
+def _make_request_builder(provider: str) -> Callable[[str], Dict[str, Any]]:
+    """Specialize request assembly for one provider around its constant system block."""
+    system_block = get_system_prompt_block(provider)
+    prefix = USER_PROMPT_PREFIX
+    
+    if provider == "Google GenAI":
+        def build(markdown_plan: str) -> Dict[str, Any]:
+            return {"system_instruction": system_block, "contents": prefix + markdown_plan}
+    else:
+        def build(markdown_plan: str) -> Dict[str, Any]:
+            return {"messages": [system_block, {"role": "user", "content": prefix + markdown_plan}]}
+    return build
+
+@functools.cache
+def get_request_builder(provider: str) -> Callable[[str], Dict[str, Any]]:
+    """
+    Get the request builder for a provider.
+    
+    The builder is created once per provider with the system prompt already
+    bound, so per-call work is only the user message.
+    
+    Args:
+        provider: The provider name ("Google GenAI" or "LM Studio (Local)")
+        
+    Returns:
+        A function mapping a plan to ``{"system_instruction", "contents"}`` for
+        Google GenAI or ``{"messages"}`` for LM Studio
+        
+    Raises:
+        ValueError: If the provider is unknown
+    """
+    return _make_request_builder(provider)
+
+# Display order for improvement severities (unknown severities sort last).
+# parse_analysis_response interns severities, so ranking is an identity check.
+_CRIT, _HIGH, _MED, _LOW = (sys.intern(s) for s in ("CRITICAL", "HIGH", "MEDIUM", "LOW"))
+_BY_RANK = operator.itemgetter(0)
+
+def _severity_rank(severity: Any) -> int:
+    """Return the display rank of a severity label."""
+    if severity is _CRIT:
+        return 0
+    elif severity is _HIGH:
+        return 1
+    elif severity is _MED:
+        return 2
+    elif severity is _LOW:
+        return 3
+    # Slow path for severities that did not come through parse_analysis_response
+    if isinstance(severity, str) and sys.intern(severity) is not severity:
+        return _severity_rank(sys.intern(severity))
+    return 99
+
+# Fields the formatter relies on, mirroring the JSON spec in the system prompt.
+# Top-level lists are optional; every item inside a list must carry its fields.
+_ANALYSIS_SCHEMA: Dict[str, Any] = {
+    "required": frozenset({"planSummary"}),
+    "items": {
+        "strengths": frozenset({"point", "reason"}),
+        "areasForImprovement": frozenset({"area", "concern", "suggestion", "severity"}),
+    },
+    "strings": ("actionableKeyPoints",),
 }
 
-**Directives for Archimedes:**
+def _validate_analysis(analysis_json: Any) -> None:
+    """
+    Check that a parsed response has the shape the formatter expects.
+    
+    Args:
+        analysis_json: The parsed JSON response from the AI model
+        
+    Raises:
+        ValueError: If a required field is missing or has the wrong type
+    """
+    if not isinstance(analysis_json, dict):
+        raise ValueError("Analysis response must be a JSON object")
+    missing = _ANALYSIS_SCHEMA["required"] - analysis_json.keys()
+    if missing:
+        raise ValueError(f"Analysis response is missing fields: {', '.join(sorted(missing))}")
+    
+    for key, fields in _ANALYSIS_SCHEMA["items"].items():
+        items = analysis_json.get(key)
+        if items is None:
+            continue
+        if not isinstance(items, list):
+            raise ValueError(f"'{key}' must be a list")
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                raise ValueError(f"'{key}[{index}]' must be an object")
+            missing = fields - item.keys()
+            if missing:
+                raise ValueError(f"'{key}[{index}]' is missing fields: {', '.join(sorted(missing))}")
+    
+    for key in _ANALYSIS_SCHEMA["strings"]:
+        items = analysis_json.get(key)
+        if items is not None and not isinstance(items, list):
+            raise ValueError(f"'{key}' must be a list")
+
+# Markdown layout of a formatted analysis, compiled once at import
+_ANALYSIS_TEMPLATE = jinja2.Environment(
+    autoescape=False,
+    trim_blocks=True,
+    keep_trailing_newline=True,
+).from_string("""\
+## 📝 Architecture Analysis (via {{ model }})
 
-*   **Be Thorough but Concise:** Provide comprehensive feedback without being verbose. Every point should add value.
-*   **Prioritize Severity:** Clearly mark the severity of identified issues, guiding the user's focus.
-*   **Explain the "Why":** Always provide the rationale behind your suggestions and concerns, linking them back to architectural principles.
-*   **Challenge Assumptions:** If a design choice seems to rely on an unstated or risky assumption, prompt the user to make it explicit or reconsider.
-*   **Encourage Iteration:** Frame the review as part of an iterative design process.
-*   **Avoid Generic Advice:** Every recommendation must be specific to the architecture presented.
-"""
+### 📜 Plan Summary
+{{ a['planSummary'] }}
+
+{% if a['strengths'] %}
+### ✅ Strengths
+{% for item in a['strengths'] %}
+- **{{ item['point'] }}:** {{ item['reason'] }}
+{% endfor %}
+{% endif %}
+{% if improvements %}
+
+### 🔍 Areas for Improvement
+{% for item in improvements %}
+- **[{{ item['severity'] }}] {{ item['area'] }}**
+  - **Concern:** {{ item['concern'] }}
+  - **Suggestion:** {{ item['suggestion'] }}
+{% endfor %}
+{% endif %}
+{% if a['actionableKeyPoints'] %}
+
+### 🚀 Actionable Key Points
+{% for point in a['actionableKeyPoints'] %}
+- {{ point }}
+{% endfor %}
+{% endif %}
+""")
+
+def _ranked_improvements(analysis_json: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the improvements sorted by severity, critical first (stable, so ties keep model order)."""
+    improvements: List[Dict[str, Any]] = analysis_json.get('areasForImprovement') or []
+    ranks = [_severity_rank(item['severity']) for item in improvements]
+    # parse_analysis_response already sorts, so this is usually a linear check
+    if all(a <= b for a, b in zip(ranks, ranks[1:])):
+        return improvements
+    ranked = sorted(zip(ranks, improvements), key=_BY_RANK)
+    return [item for _, item in ranked]
+
+def format_analysis_response_iter(analysis_json: Dict[str, Any], model_choice: str) -> Iterator[str]:
+    """
+    Format the JSON analysis response into markdown, chunk by chunk.
+    
+    The response is validated up front; the returned iterator then yields the
+    document in order so a streaming UI can render it progressively.
+    
+    Args:
+        analysis_json: The parsed JSON response from the AI model
+        model_choice: The name of the model used for analysis
+        
+    Returns:
+        Iterator over consecutive markdown fragments
+        
+    Raises:
+        ValueError: If the response is missing fields the formatter needs
+    """
+    _validate_analysis(analysis_json)
+    return _ANALYSIS_TEMPLATE.generate(
+        a=analysis_json, improvements=_ranked_improvements(analysis_json), model=model_choice
+    )
 
 def format_analysis_response(analysis_json: Dict[str, Any], model_choice: str) -> str:
     """
@@ -111,40 +324,41 @@ def format_analysis_response(analysis_json: Dict[str, Any], model_choice: str) -
         
     Returns:
         Formatted markdown string for display
+        
+    Raises:
+        ValueError: If the response is missing fields the formatter needs
     """
-    output_md = f"## 📝 Architecture Analysis (via {model_choice})\n\n"
-    output_md += f"### 📜 Plan Summary\n{analysis_json['planSummary']}\n\n"
-    
-    if analysis_json.get('strengths'):
-        output_md += f"### ✅ Strengths\n"
-        for item in analysis_json['strengths']:
-            output_md += f"- **{item['point']}:** {item['reason']}\n"
+    return "".join(format_analysis_response_iter(analysis_json, model_choice))
+
+# A JSON object wrapped in a markdown code fence, as some models return despite JSON mode
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL)
+
+def _extract_json_object(response_text: str) -> Optional[str]:
+    """
+    Find the JSON object in a response that has prose or a code fence around it.
     
-    if analysis_json.get('areasForImprovement'):
-        output_md += f"\n### 🔍 Areas for Improvement\n"
-        # Sort by severity to show critical items first
-        severity_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
-        sorted_improvements = sorted(
-            analysis_json['areasForImprovement'], 
-            key=lambda x: severity_order.get(x['severity'], 99)
-        )
+    Args:
+        response_text: Raw response text from the AI model
         
-        for item in sorted_improvements:
-            output_md += f"- **[{item['severity']}] {item['area']}**\n"
-            output_md += f"  - **Concern:** {item['concern']}\n"
-            output_md += f"  - **Suggestion:** {item['suggestion']}\n"
-    
-    if analysis_json.get('actionableKeyPoints'):
-        output_md += f"\n### 🚀 Actionable Key Points\n"
-        for point in analysis_json['actionableKeyPoints']:
-            output_md += f"- {point}\n"
-    
-    return output_md
+    Returns:
+        The candidate JSON object text, or None if the response contains no braces
+    """
+    fenced = _JSON_FENCE.search(response_text)
+    if fenced:
+        return fenced.group(1)
+    start = response_text.find("{")
+    end = response_text.rfind("}")
+    return response_text[start:end + 1] if 0 <= start < end else None
 
 def parse_analysis_response(response_text: str) -> Dict[str, Any]:
     """
     Parse the AI response text into a structured format.
     
+    ``areasForImprovement`` is sorted in place by severity (critical first,
+    stable for ties) and its severity labels are interned, so formatting the
+    result any number of times does not re-sort it. If the response is not
+    pure JSON, the object inside a code fence or surrounding prose is used.
+    
     Args:
         response_text: Raw response text from the AI model
         
@@ -159,10 +373,117 @@ def parse_analysis_response(response_text: str) -> Dict[str, Any]:
         raise ValueError("Empty response from AI model")
     
     try:
-        analysis_json = json.loads(response_text)
-        return analysis_json
-    except json.JSONDecodeError as e:
-        raise json.JSONDecodeError(f"Invalid JSON response: {str(e)}", response_text, e.pos)
+        analysis_json: Dict[str, Any] = orjson.loads(response_text)
+    except orjson.JSONDecodeError as e:
+        # Only pay for the search when the fast path fails
+        candidate = _extract_json_object(response_text)
+        if candidate is None or candidate == response_text:
+            raise json.JSONDecodeError(f"Invalid JSON response: {str(e)}", response_text, e.pos)
+        try:
+            analysis_json = orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            raise json.JSONDecodeError(f"Invalid JSON response: {str(e)}", response_text, e.pos)
+    
+    # Intern severities once so the formatter can rank them by identity, then sort once
+    if isinstance(analysis_json, dict):
+        improvements = analysis_json.get('areasForImprovement')
+        if isinstance(improvements, list) and all(isinstance(item, dict) for item in improvements):
+            for item in improvements:
+                if isinstance(item.get('severity'), str):
+                    item['severity'] = sys.intern(item['severity'])
+            improvements.sort(key=lambda item: _severity_rank(item.get('severity')))
+    return analysis_json
+
+_WORD = re.compile(r"\w+")
+
+class PlanAnalysisCache:
+    """
+    LRU cache of analyses keyed by plan, with near-duplicate lookup.
+    
+    Exact repeats are found by a BLAKE2b digest of the plan. On request, the
+    plan is also compared against cached plans by cosine similarity of their
+    word-count vectors. Word counts miss changed numbers, names and negations,
+    so a near-duplicate hit is a suggestion, never a substitute for analysis.
+    """
+    
+    def __init__(self, maxsize: int = 128, threshold: float = 0.92):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of analyses to keep
+            threshold: Minimum cosine similarity for a near-duplicate hit
+        """
+        self.maxsize = maxsize
+        self.threshold = threshold
+        # digest -> (word vector, vector norm, analysis)
+        self._entries: "OrderedDict[bytes, Tuple[Counter[str], float, Dict[str, Any]]]" = OrderedDict()
+    
+    @staticmethod
+    def _digest(plan: str) -> bytes:
+        return hashlib.blake2b(plan.encode("utf-8"), digest_size=16).digest()
+    
+    @staticmethod
+    def _vectorize(plan: str) -> Tuple["Counter[str]", float]:
+        vector = Counter(_WORD.findall(plan.lower()))
+        return vector, math.sqrt(sum(n * n for n in vector.values()))
+    
+    def get(self, plan: str, near_duplicates: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached analysis for the plan, or optionally a near-duplicate of it.
+        
+        Args:
+            plan: The architecture plan in markdown format
+            near_duplicates: Also match cached plans above the similarity threshold
+            
+        Returns:
+            The cached analysis, or None on a miss
+        """
+        digest = self._digest(plan)
+        entry = self._entries.get(digest)
+        if entry is None:
+            if not near_duplicates:
+                return None
+            vector, norm = self._vectorize(plan)
+            if not norm:
+                return None
+            best_score = self.threshold
+            for key, (other, other_norm, _) in self._entries.items():
+                dot = sum(count * other[word] for word, count in vector.items())
+                score = dot / (norm * other_norm)
+                if score >= best_score:
+                    best_score, digest = score, key
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+        
+        analysis = entry[2]
+        try:
+            _validate_analysis(analysis)
+        except ValueError:
+            del self._entries[digest]
+            return None
+        self._entries.move_to_end(digest)
+        return analysis
+    
+    def put(self, plan: str, analysis_json: Dict[str, Any]) -> None:
+        """
+        Store an analysis for the plan, evicting the least recently used entry if full.
+        
+        Args:
+            plan: The architecture plan in markdown format
+            analysis_json: The parsed analysis for the plan
+        """
+        digest = self._digest(plan)
+        vector, norm = self._vectorize(plan)
+        if not norm:
+            return
+        self._entries[digest] = (vector, norm, analysis_json)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+_HAS_NONSPACE = re.compile(r"\S").search
 
 def validate_input(markdown_plan: str) -> bool:
     """
@@ -174,25 +495,5 @@ def validate_input(markdown_plan: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    return bool(markdown_plan and markdown_plan.strip())
-
-# Example plan for UI demonstration
-EXAMPLE_PLAN = """
-# Project: Real-time User Analytics Dashboard
-
-## 1. Overview
-This system will track user clicks on a website and display them on a real-time dashboard.
-
-## 2. Components
-- **Frontend:** A React single-page application (SPA).
-- **API:** A single Node.js monolith running on a single EC2 instance. It will have two endpoints:
-  - `POST /event`: Receives click data.
-  - `GET /dashboard`: Uses websockets to push data to the frontend.
-- **Database:** A PostgreSQL database on the same EC2 instance as the API. It stores all click events in a single table.
-
-## 3. Data Flow
-1. User clicks on the website.
-2. React app sends a request to `POST /event`.
-3. The Node.js API writes the event to the PostgreSQL database.
-4. The API also pushes the event over a websocket to all connected dashboard clients.
-"""
+    # Stops at the first non-whitespace character instead of copying a stripped plan
+    return bool(markdown_plan) and _HAS_NONSPACE(markdown_plan) is not None
@@ -4,9 +4,10 @@ Export utilities for generating PDF and detailed reports.
 
 import os
 import json
-import datetime
+import functools
 import logging
-from typing import Dict, Any, List, Optional, Union, Tuple
+import time
+from typing import Dict, Any, BinaryIO, FrozenSet, List, NamedTuple, Optional, Union, Tuple
 import base64
 from io import BytesIO
 
@@ -14,12 +15,10 @@ from io import BytesIO
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Preformatted, Spacer, Image, Table, TableStyle
 from reportlab.lib.units import inch
 import reportlab.platypus as platypus
-import markdown
-import pdfkit
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import ChoiceLoader, DictLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
 # Project imports
 from config import EXPORT_FORMATS, DEFAULT_EXPORT_FORMAT, EXPORT_OUTPUT_DIR, PDF_THEME, APP_TITLE
@@ -28,273 +27,45 @@ from config import EXPORT_FORMATS, DEFAULT_EXPORT_FORMAT, EXPORT_OUTPUT_DIR, PDF
 logger = logging.getLogger(__name__)
 
 
-class ExportManager:
-    """Manager class for handling all export operations."""
+class ExportError(Exception):
+    """Raised when an analysis cannot be exported."""
+    pass
 
-    def __init__(self, output_dir: str = EXPORT_OUTPUT_DIR):
-        """Initialize the export manager.
-        
-        Args:
-            output_dir: Directory to save exports to
-        """
-        self.output_dir = output_dir
-        self._ensure_export_directory()
-        
-        # Initialize Jinja for HTML templates
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), 'templates')),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
-    
-    def _ensure_export_directory(self) -> None:
-        """Ensure the export directory exists."""
-        if not os.path.exists(self.output_dir):
-            try:
-                os.makedirs(self.output_dir)
-                logger.info(f"Created export directory: {self.output_dir}")
-            except Exception as e:
-                logger.error(f"Failed to create export directory: {str(e)}")
-                raise
-    
-    def _generate_filename(self, prefix: str, extension: str) -> str:
-        """Generate a timestamped filename for exports.
-        
-        Args:
-            prefix: Prefix for the filename
-            extension: File extension (without dot)
-            
-        Returns:
-            Full path to the generated filename
-        """
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{prefix}_{timestamp}.{extension}"
-        return os.path.join(self.output_dir, filename)
-    
-    def export_analysis(self, 
-                       analysis_data: Dict[str, Any], 
-                       markdown_plan: str, 
-                       model_used: str,
-                       export_format: str = DEFAULT_EXPORT_FORMAT) -> str:
-        """Export analysis results in the specified format.
-        
-        Args:
-            analysis_data: The analysis data dictionary
-            markdown_plan: The original architecture plan
-            model_used: The model used for analysis
-            export_format: Format to export as (PDF, HTML, Markdown)
-            
-        Returns:
-            Path to the exported file
-        """
-        if export_format.upper() not in EXPORT_FORMATS:
-            raise ValueError(f"Unsupported export format: {export_format}. Supported formats: {', '.join(EXPORT_FORMATS)}")
-        
-        if export_format.upper() == "PDF":
-            return self.generate_pdf_report(analysis_data, markdown_plan, model_used)
-        elif export_format.upper() == "HTML":
-            return self.generate_html_report(analysis_data, markdown_plan, model_used)
-        elif export_format.upper() == "MARKDOWN":
-            return self.generate_markdown_report(analysis_data, markdown_plan, model_used)
-        else:
-            raise ValueError(f"Unhandled export format: {export_format}")
-    
-    def generate_pdf_report(self, 
-                           analysis_data: Dict[str, Any], 
-                           markdown_plan: str, 
-                           model_used: str) -> str:
-        """Generate a PDF report of the architecture analysis.
-        
-        Args:
-            analysis_data: The analysis data dictionary
-            markdown_plan: The original architecture plan
-            model_used: The model used for analysis
-            
-        Returns:
-            Path to the generated PDF file
-        """
-        output_path = self._generate_filename("architecture_analysis", "pdf")
-        
-        # Create the PDF document
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=A4,
-            rightMargin=PDF_THEME.get("page_margin", 50),
-            leftMargin=PDF_THEME.get("page_margin", 50),
-            topMargin=PDF_THEME.get("page_margin", 50),
-            bottomMargin=PDF_THEME.get("page_margin", 50)
-        )
-        
-        # Create styles
-        styles = getSampleStyleSheet()
-        
-        # Custom styles based on theme
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Title'],
-            fontName=PDF_THEME.get("title_font", "Helvetica-Bold"),
-            fontSize=PDF_THEME.get("title_size", 24),
-            textColor=colors.HexColor(PDF_THEME.get("primary_color", "#667eea")),
-            spaceAfter=36
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading1'],
-            fontName=PDF_THEME.get("header_font", "Helvetica-Bold"),
-            fontSize=PDF_THEME.get("header_size", 16),
-            textColor=colors.HexColor(PDF_THEME.get("secondary_color", "#764ba2")),
-            spaceAfter=12
-        )
-        
-        normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=styles['Normal'],
-            fontName=PDF_THEME.get("body_font", "Helvetica"),
-            fontSize=PDF_THEME.get("body_size", 11),
-            textColor=colors.HexColor(PDF_THEME.get("text_color", "#333333")),
-        )
-        
-        # Build the content
-        content = []
-        
-        # Title
-        content.append(Paragraph(APP_TITLE, title_style))
-        content.append(Paragraph("Architecture Analysis Report", heading_style))
-        content.append(Spacer(1, 0.25*inch))
-        
-        # Metadata
-        content.append(Paragraph(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}", normal_style))
-        content.append(Paragraph(f"Model Used: {model_used}", normal_style))
-        content.append(Spacer(1, 0.25*inch))
-        
-        # Executive Summary
-        content.append(Paragraph("Executive Summary", heading_style))
-        content.append(Paragraph(analysis_data.get("summaryOfReviewerObservations", "No summary provided."), normal_style))
-        content.append(Spacer(1, 0.25*inch))
-        
-        # Plan Summary
-        content.append(Paragraph("System Plan Overview", heading_style))
-        content.append(Paragraph(analysis_data.get("planSummary", "No summary provided."), normal_style))
-        content.append(Spacer(1, 0.25*inch))
-        
-        # Strengths
-        content.append(Paragraph("Strengths", heading_style))
-        strengths = analysis_data.get("strengths", [])
-        if strengths:
-            for strength in strengths:
-                content.append(Paragraph(f"<b>{strength.get('dimension', '')}</b>: {strength.get('point', '')}", normal_style))
-                content.append(Paragraph(f"<i>Rationale:</i> {strength.get('reason', '')}", normal_style))
-                content.append(Spacer(1, 0.1*inch))
-        else:
-            content.append(Paragraph("No strengths identified.", normal_style))
-        content.append(Spacer(1, 0.25*inch))
-        
-        # Areas for Improvement
-        content.append(Paragraph("Areas for Improvement", heading_style))
-        areas = analysis_data.get("areasForImprovement", [])
-        if areas:
-            for area in areas:
-                severity = area.get("severity", "").upper()
-                severity_color = "#FF0000" if severity == "CRITICAL" else "#FFA500" if severity == "HIGH" else "#FFCC00" if severity == "MEDIUM" else "#008000"
-                
-                content.append(Paragraph(f"<b>{area.get('area', '')}</b> - <font color='{severity_color}'>{severity}</font>", normal_style))
-                content.append(Paragraph(f"<i>Concern:</i> {area.get('concern', '')}", normal_style))
-                content.append(Paragraph(f"<i>Suggestion:</i> {area.get('suggestion', '')}", normal_style))
-                content.append(Paragraph(f"<i>Impact:</i> {area.get('impact', '')}", normal_style))
-                
-                if area.get("tradeOffsConsidered"):
-                    content.append(Paragraph(f"<i>Trade-offs:</i> {area.get('tradeOffsConsidered', '')}", normal_style))
-                
-                content.append(Spacer(1, 0.1*inch))
-        else:
-            content.append(Paragraph("No areas for improvement identified.", normal_style))
-        content.append(Spacer(1, 0.25*inch))
-        
-        # Strategic Recommendations
-        content.append(Paragraph("Strategic Recommendations", heading_style))
-        recommendations = analysis_data.get("strategicRecommendations", [])
-        if recommendations:
-            for rec in recommendations:
-                content.append(Paragraph(f"<b>{rec.get('recommendation', '')}</b>", normal_style))
-                content.append(Paragraph(f"<i>Rationale:</i> {rec.get('rationale', '')}", normal_style))
-                content.append(Paragraph(f"<i>Implications:</i> {rec.get('potentialImplications', '')}", normal_style))
-                content.append(Spacer(1, 0.1*inch))
-        else:
-            content.append(Paragraph("No strategic recommendations provided.", normal_style))
-        content.append(Spacer(1, 0.25*inch))
-        
-        # Next Steps
-        content.append(Paragraph("Next Steps", heading_style))
-        next_steps = analysis_data.get("nextStepsAndConsiderations", [])
-        if next_steps:
-            for i, step in enumerate(next_steps, 1):
-                content.append(Paragraph(f"{i}. {step}", normal_style))
-                content.append(Spacer(1, 0.05*inch))
-        else:
-            content.append(Paragraph("No next steps provided.", normal_style))
-        content.append(Spacer(1, 0.25*inch))
-        
-        # Original Plan
-        content.append(Paragraph("Original Architecture Plan", heading_style))
-        content.append(Paragraph(markdown_plan, normal_style))
-        
-        # Build the PDF
-        doc.build(content)
-        
-        logger.info(f"Generated PDF report: {output_path}")
-        return output_path
-    
-    def generate_html_report(self, 
-                            analysis_data: Dict[str, Any], 
-                            markdown_plan: str, 
-                            model_used: str) -> str:
-        """Generate an HTML report of the architecture analysis.
-        
-        Args:
-            analysis_data: The analysis data dictionary
-            markdown_plan: The original architecture plan
-            model_used: The model used for analysis
-            
-        Returns:
-            Path to the generated HTML file
-        """
-        output_path = self._generate_filename("architecture_analysis", "html")
-        
-        # Create templates directory if it doesn't exist
-        templates_dir = os.path.join(os.path.dirname(__file__), 'templates')
-        if not os.path.exists(templates_dir):
-            os.makedirs(templates_dir)
-        
-        # Check if template exists, create it if not
-        template_path = os.path.join(templates_dir, 'report_template.html')
-        if not os.path.exists(template_path):
-            self._create_default_html_template(template_path)
-            
-        # Prepare template data
-        template_data = {
-            "app_title": APP_TITLE,
-            "generated_date": datetime.datetime.now().strftime('%Y-%m-%d %H:%M'),
-            "model_used": model_used,
-            "analysis": analysis_data,
-            "original_plan": markdown_plan,
-            "primary_color": PDF_THEME.get("primary_color", "#667eea"),
-            "secondary_color": PDF_THEME.get("secondary_color", "#764ba2"),
-        }
-        
-        # Render template
-        template = self.jinja_env.get_template('report_template.html')
-        html_content = template.render(**template_data)
-        
-        # Write HTML file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        logger.info(f"Generated HTML report: {output_path}")
-        return output_path
+# Write buffer for PDF files, large enough that a report is flushed in one go
+PDF_WRITE_BUFFER_SIZE = 1 << 20
+MARKDOWN_WRITE_BUFFER_SIZE = 1 << 20
+HTML_WRITE_BUFFER_SIZE = 1 << 20
+
+# Preformatted text does not wrap, so long plan lines are split at this many characters
+PDF_PLAN_MAX_LINE_LENGTH = 85
+
+# PDF colors for improvement severities (unknown severities fall back to green)
+SEVERITY_COLORS = {
+    "CRITICAL": "#FF0000",
+    "HIGH": "#FFA500",
+    "MEDIUM": "#FFCC00",
+    "LOW": "#008000",
+}
+DEFAULT_SEVERITY_COLOR = "#008000"
 
-    def _create_default_html_template(self, template_path: str) -> None:
-        """Create a default HTML template file if it doesn't exist."""
-        default_template = '''<!DOCTYPE html>
+# One ReportLab paragraph per PDF record, with lines separated by <br/>
+PDF_STRENGTH_TEMPLATE = "<b>{dimension}</b>: {point}<br/><i>Rationale:</i> {reason}"
+PDF_AREA_TEMPLATE = (
+    "<b>{area}</b> - <font color='{color}'>{severity}</font>"
+    "<br/><i>Concern:</i> {concern}"
+    "<br/><i>Suggestion:</i> {suggestion}"
+    "<br/><i>Impact:</i> {impact}"
+)
+PDF_TRADE_OFFS_TEMPLATE = "<br/><i>Trade-offs:</i> {trade_offs}"
+PDF_RECOMMENDATION_TEMPLATE = (
+    "<b>{recommendation}</b>"
+    "<br/><i>Rationale:</i> {rationale}"
+    "<br/><i>Implications:</i> {implications}"
+)
+
+# Built-in HTML report template. A templates/report_template.html file, if present,
+# takes precedence so the report can be customized without code changes.
+DEFAULT_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -497,118 +268,466 @@ class ExportManager:
     </div>
 </body>
 </html>'''
+
+# Built-in Markdown report template, overridable with templates/report_template.md.
+# Block tags use "-%}" so the output does not depend on the environment's trim_blocks.
+DEFAULT_MARKDOWN_TEMPLATE = '''# {{ app_title }}
+## Architecture Analysis Report
+
+**Generated:** {{ generated_date }}
+**Model Used:** {{ model_used }}
+
+## Executive Summary
+{{ analysis.get("summaryOfReviewerObservations", "No summary provided.") }}
+
+## System Plan Overview
+{{ analysis.get("planSummary", "No summary provided.") }}
+
+## Strengths
+{% for strength in analysis.get("strengths") or [] -%}
+### {{ strength["dimension"] }}
+**Point:** {{ strength["point"] }}
+**Rationale:** {{ strength["reason"] }}
+
+{% else -%}
+No strengths identified.
+
+{% endfor -%}
+## Areas for Improvement
+{% for area in analysis.get("areasForImprovement") or [] -%}
+### {{ area["area"] }} - {{ area["severity"] | upper }}
+**Concern:** {{ area["concern"] }}
+**Suggestion:** {{ area["suggestion"] }}
+**Impact:** {{ area["impact"] }}
+{% if area["tradeOffsConsidered"] -%}
+**Trade-offs:** {{ area["tradeOffsConsidered"] }}
+{% endif -%}
+{{ "\n" }}{% else -%}
+No areas for improvement identified.
+
+{% endfor -%}
+## Strategic Recommendations
+{% for rec in analysis.get("strategicRecommendations") or [] -%}
+### {{ rec["recommendation"] }}
+**Rationale:** {{ rec["rationale"] }}
+**Implications:** {{ rec["potentialImplications"] }}
+
+{% else -%}
+No strategic recommendations provided.
+
+{% endfor -%}
+## Next Steps
+{% for step in analysis.get("nextStepsAndConsiderations") or [] -%}
+{{ loop.index }}. {{ step }}
+{% else -%}
+No next steps provided.
+{% endfor -%}
+{{ "\n" }}## Original Architecture Plan
+```markdown
+{{ original_plan }}
+```'''
+
+# Templates compiled eagerly when the shared environment is created
+REPORT_TEMPLATES = ('report_template.html', 'report_template.md')
+
+# Shared Jinja environment, so compiled templates are cached across all export calls
+_JINJA_ENV: Optional[Environment] = None
+
+
+def _get_jinja_env() -> Environment:
+    """Get the shared Jinja environment, creating it on first use."""
+    global _JINJA_ENV
+    if _JINJA_ENV is None:
+        _JINJA_ENV = Environment(
+            loader=ChoiceLoader([
+                FileSystemLoader(os.path.join(os.path.dirname(__file__), 'templates')),
+                DictLoader({
+                    'report_template.html': DEFAULT_HTML_TEMPLATE,
+                    'report_template.md': DEFAULT_MARKDOWN_TEMPLATE
+                })
+            ]),
+            autoescape=select_autoescape(['html', 'xml']),
+            auto_reload=False,
+            cache_size=-1,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            # Compiled bytecode persists across restarts in Jinja's per-user,
+            # owner-checked 0700 temp directory
+            bytecode_cache=FileSystemBytecodeCache()
+        )
+        # Compile the report templates up front so the first export only renders
+        for name in REPORT_TEMPLATES:
+            _JINJA_ENV.get_template(name)
+    return _JINJA_ENV
+
+
+class _PdfTheme(NamedTuple):
+    """PDF theme settings resolved once from PDF_THEME."""
+    title_style: ParagraphStyle
+    heading_style: ParagraphStyle
+    normal_style: ParagraphStyle
+    page_margin: float
+
+
+@functools.lru_cache(maxsize=4)
+def _get_pdf_theme(theme_items: FrozenSet[Tuple[str, Any]]) -> _PdfTheme:
+    """Resolve the paragraph styles and page layout for a PDF theme.
+    
+    Args:
+        theme_items: The theme settings as a frozenset of (key, value) pairs
         
-        # Create templates directory if it doesn't exist
-        os.makedirs(os.path.dirname(template_path), exist_ok=True)
+    Returns:
+        The resolved theme, with defaults applied
+    """
+    theme = dict(theme_items)
+    styles = getSampleStyleSheet()
+    
+    # Custom styles based on theme
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Title'],
+        fontName=theme.get("title_font", "Helvetica-Bold"),
+        fontSize=theme.get("title_size", 24),
+        textColor=colors.HexColor(theme.get("primary_color", "#667eea")),
+        spaceAfter=36
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading1'],
+        fontName=theme.get("header_font", "Helvetica-Bold"),
+        fontSize=theme.get("header_size", 16),
+        textColor=colors.HexColor(theme.get("secondary_color", "#764ba2")),
+        spaceAfter=12
+    )
+    
+    normal_style = ParagraphStyle(
+        'CustomNormal',
+        parent=styles['Normal'],
+        fontName=theme.get("body_font", "Helvetica"),
+        fontSize=theme.get("body_size", 11),
+        textColor=colors.HexColor(theme.get("text_color", "#333333")),
+    )
+    
+    return _PdfTheme(title_style, heading_style, normal_style, theme.get("page_margin", 50))
+
+
+def _now_strings() -> Tuple[str, str]:
+    """Format the current time once for export filenames and report headers.
+    
+    Returns:
+        Tuple of (filename_timestamp, display_timestamp)
+    """
+    now = time.localtime()
+    return time.strftime("%Y%m%d_%H%M%S", now), time.strftime('%Y-%m-%d %H:%M', now)
+
+
+# Generator method for each export format, keyed by the upper-cased format name
+_FORMAT_DISPATCH = {
+    "PDF": "generate_pdf_report",
+    "HTML": "generate_html_report",
+    "MARKDOWN": "generate_markdown_report",
+}
+
+
+class ExportManager:
+    """Manager class for handling all export operations."""
+
+    def __init__(self, output_dir: str = EXPORT_OUTPUT_DIR):
+        """Initialize the export manager.
         
-        # Write template file
-        with open(template_path, 'w', encoding='utf-8') as f:
-            f.write(default_template)
+        Args:
+            output_dir: Directory to save exports to
+        """
+        self.output_dir = output_dir
+        self._ensure_export_directory()
         
-        logger.info(f"Created default HTML template: {template_path}")
+        # Shared Jinja environment for HTML templates
+        self.jinja_env = _get_jinja_env()
     
-    def generate_markdown_report(self, 
-                               analysis_data: Dict[str, Any], 
-                               markdown_plan: str, 
-                               model_used: str) -> str:
-        """Generate a Markdown report of the architecture analysis.
+    def _ensure_export_directory(self) -> None:
+        """Ensure the export directory exists."""
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+        except Exception as e:
+            logger.error(f"Failed to create export directory: {str(e)}")
+            raise
+    
+    def _generate_filename(self, prefix: str, extension: str, timestamp: Optional[str] = None) -> str:
+        """Generate a timestamped filename for exports.
+        
+        Args:
+            prefix: Prefix for the filename
+            extension: File extension (without dot)
+            timestamp: Filename timestamp to use; the current time if omitted
+            
+        Returns:
+            Full path to the generated filename
+        """
+        if timestamp is None:
+            timestamp = _now_strings()[0]
+        filename = f"{prefix}_{timestamp}.{extension}"
+        return os.path.join(self.output_dir, filename)
+    
+    def export_analysis(self, 
+                       analysis_data: Dict[str, Any], 
+                       markdown_plan: str, 
+                       model_used: str,
+                       export_format: str = DEFAULT_EXPORT_FORMAT) -> str:
+        """Export analysis results in the specified format.
         
         Args:
             analysis_data: The analysis data dictionary
             markdown_plan: The original architecture plan
             model_used: The model used for analysis
+            export_format: Format to export as (PDF, HTML, Markdown)
             
         Returns:
-            Path to the generated Markdown file
+            Absolute path to the written file
+            
+        Raises:
+            ExportError: If the format is unsupported or the file could not be written
         """
-        output_path = self._generate_filename("architecture_analysis", "md")
+        method = _FORMAT_DISPATCH.get(export_format.upper())
+        if method is None:
+            raise ExportError(f"Unsupported export format: {export_format}. Supported formats: {', '.join(EXPORT_FORMATS)}")
+        
+        try:
+            return os.path.abspath(getattr(self, method)(analysis_data, markdown_plan, model_used, _now_strings()))
+        except Exception as e:
+            logger.error(f"Failed to export {export_format}: {str(e)}")
+            raise ExportError(f"Failed to export {export_format}: {str(e)}") from e
+    
+    def generate_pdf_report(self, 
+                           analysis_data: Dict[str, Any], 
+                           markdown_plan: str, 
+                           model_used: str,
+                           timestamps: Optional[Tuple[str, str]] = None) -> str:
+        """Generate a PDF report of the architecture analysis.
         
-        # Build markdown content
-        md_content = []
+        Args:
+            analysis_data: The analysis data dictionary
+            markdown_plan: The original architecture plan
+            model_used: The model used for analysis
+            timestamps: (filename, display) timestamps from _now_strings(); the current time if omitted
+            
+        Returns:
+            Path to the generated PDF file
+        """
+        filename_ts, display_ts = timestamps or _now_strings()
+        output_path = self._generate_filename("architecture_analysis", "pdf", filename_ts)
         
-        # Header
-        md_content.append(f"# {APP_TITLE}")
-        md_content.append("## Architecture Analysis Report")
-        md_content.append("")
+        with open(output_path, 'wb', buffering=PDF_WRITE_BUFFER_SIZE) as output:
+            self._build_pdf(output, analysis_data, markdown_plan, model_used, display_ts)
         
-        # Metadata
-        md_content.append(f"**Generated:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}")
-        md_content.append(f"**Model Used:** {model_used}")
-        md_content.append("")
+        logger.info(f"Generated PDF report: {output_path}")
+        return output_path
+    
+    def _build_pdf(self,
+                   output: BinaryIO,
+                   analysis_data: Dict[str, Any],
+                   markdown_plan: str,
+                   model_used: str,
+                   generated_date: str) -> None:
+        """Render the PDF report into a writable binary file object.
+        
+        Args:
+            output: File object the PDF bytes are written to
+            analysis_data: The analysis data dictionary
+            markdown_plan: The original architecture plan
+            model_used: The model used for analysis
+            generated_date: Display timestamp shown in the report metadata
+        """
+        # Theme settings are resolved once per theme and reused across reports
+        theme = _get_pdf_theme(frozenset(PDF_THEME.items()))
+        title_style, heading_style, normal_style = theme.title_style, theme.heading_style, theme.normal_style
         
-        # Executive Summary
-        md_content.append("## Executive Summary")
-        md_content.append(analysis_data.get("summaryOfReviewerObservations", "No summary provided."))
-        md_content.append("")
+        # Create the PDF document
+        doc = SimpleDocTemplate(
+            output,
+            pagesize=A4,
+            rightMargin=theme.page_margin,
+            leftMargin=theme.page_margin,
+            topMargin=theme.page_margin,
+            bottomMargin=theme.page_margin
+        )
         
-        # Plan Summary
-        md_content.append("## System Plan Overview")
-        md_content.append(analysis_data.get("planSummary", "No summary provided."))
-        md_content.append("")
+        # Build the content, one extend per section
+        content: List[Any] = []
+        
+        # Title and metadata
+        content.extend((
+            Paragraph(APP_TITLE, title_style),
+            Paragraph("Architecture Analysis Report", heading_style),
+            Spacer(1, 0.25*inch),
+            Paragraph(f"Generated: {generated_date}", normal_style),
+            Paragraph(f"Model Used: {model_used}", normal_style),
+            Spacer(1, 0.25*inch),
+        ))
+        
+        # Executive Summary and Plan Summary
+        content.extend((
+            Paragraph("Executive Summary", heading_style),
+            Paragraph(analysis_data.get("summaryOfReviewerObservations", "No summary provided."), normal_style),
+            Spacer(1, 0.25*inch),
+            Paragraph("System Plan Overview", heading_style),
+            Paragraph(analysis_data.get("planSummary", "No summary provided."), normal_style),
+            Spacer(1, 0.25*inch),
+            Paragraph("Strengths", heading_style),
+        ))
         
         # Strengths
-        md_content.append("## Strengths")
         strengths = analysis_data.get("strengths", [])
         if strengths:
             for strength in strengths:
-                md_content.append(f"### {strength.get('dimension', '')}")
-                md_content.append(f"**Point:** {strength.get('point', '')}")
-                md_content.append(f"**Rationale:** {strength.get('reason', '')}")
-                md_content.append("")
+                content.extend((
+                    Paragraph(PDF_STRENGTH_TEMPLATE.format(
+                        dimension=strength.get('dimension', ''),
+                        point=strength.get('point', ''),
+                        reason=strength.get('reason', '')
+                    ), normal_style),
+                    Spacer(1, 0.1*inch),
+                ))
         else:
-            md_content.append("No strengths identified.")
-            md_content.append("")
+            content.append(Paragraph("No strengths identified.", normal_style))
+        content.extend((Spacer(1, 0.25*inch), Paragraph("Areas for Improvement", heading_style)))
         
         # Areas for Improvement
-        md_content.append("## Areas for Improvement")
         areas = analysis_data.get("areasForImprovement", [])
         if areas:
             for area in areas:
-                md_content.append(f"### {area.get('area', '')} - {area.get('severity', '').upper()}")
-                md_content.append(f"**Concern:** {area.get('concern', '')}")
-                md_content.append(f"**Suggestion:** {area.get('suggestion', '')}")
-                md_content.append(f"**Impact:** {area.get('impact', '')}")
-                
+                severity = area.get("severity", "").upper()
+                text = PDF_AREA_TEMPLATE.format(
+                    area=area.get('area', ''),
+                    color=SEVERITY_COLORS.get(severity, DEFAULT_SEVERITY_COLOR),
+                    severity=severity,
+                    concern=area.get('concern', ''),
+                    suggestion=area.get('suggestion', ''),
+                    impact=area.get('impact', '')
+                )
                 if area.get("tradeOffsConsidered"):
-                    md_content.append(f"**Trade-offs:** {area.get('tradeOffsConsidered', '')}")
+                    text += PDF_TRADE_OFFS_TEMPLATE.format(trade_offs=area["tradeOffsConsidered"])
                 
-                md_content.append("")
+                content.extend((Paragraph(text, normal_style), Spacer(1, 0.1*inch)))
         else:
-            md_content.append("No areas for improvement identified.")
-            md_content.append("")
+            content.append(Paragraph("No areas for improvement identified.", normal_style))
+        content.extend((Spacer(1, 0.25*inch), Paragraph("Strategic Recommendations", heading_style)))
         
         # Strategic Recommendations
-        md_content.append("## Strategic Recommendations")
         recommendations = analysis_data.get("strategicRecommendations", [])
         if recommendations:
             for rec in recommendations:
-                md_content.append(f"### {rec.get('recommendation', '')}")
-                md_content.append(f"**Rationale:** {rec.get('rationale', '')}")
-                md_content.append(f"**Implications:** {rec.get('potentialImplications', '')}")
-                md_content.append("")
+                content.extend((
+                    Paragraph(PDF_RECOMMENDATION_TEMPLATE.format(
+                        recommendation=rec.get('recommendation', ''),
+                        rationale=rec.get('rationale', ''),
+                        implications=rec.get('potentialImplications', '')
+                    ), normal_style),
+                    Spacer(1, 0.1*inch),
+                ))
         else:
-            md_content.append("No strategic recommendations provided.")
-            md_content.append("")
+            content.append(Paragraph("No strategic recommendations provided.", normal_style))
+        content.extend((Spacer(1, 0.25*inch), Paragraph("Next Steps", heading_style)))
         
         # Next Steps
-        md_content.append("## Next Steps")
         next_steps = analysis_data.get("nextStepsAndConsiderations", [])
         if next_steps:
             for i, step in enumerate(next_steps, 1):
-                md_content.append(f"{i}. {step}")
+                content.extend((Paragraph(f"{i}. {step}", normal_style), Spacer(1, 0.05*inch)))
         else:
-            md_content.append("No next steps provided.")
-        md_content.append("")
+            content.append(Paragraph("No next steps provided.", normal_style))
         
         # Original Plan
-        md_content.append("## Original Architecture Plan")
-        md_content.append("```markdown")
-        md_content.append(markdown_plan)
-        md_content.append("```")
+        content.extend((
+            Spacer(1, 0.25*inch),
+            Paragraph("Original Architecture Plan", heading_style),
+            # Literal text: no markup parsing, and '<' or '&' in the plan are safe
+            Preformatted(markdown_plan, normal_style, maxLineLength=PDF_PLAN_MAX_LINE_LENGTH),
+        ))
+        
+        # Build the PDF
+        doc.build(content)
+    
+    def _template_context(self,
+                          analysis_data: Dict[str, Any],
+                          markdown_plan: str,
+                          model_used: str,
+                          generated_date: str) -> Dict[str, Any]:
+        """Build the context shared by the HTML and Markdown report templates.
+        
+        Args:
+            analysis_data: The analysis data dictionary
+            markdown_plan: The original architecture plan
+            model_used: The model used for analysis
+            generated_date: Display timestamp shown in the report
+            
+        Returns:
+            Template context dictionary
+        """
+        return {
+            "app_title": APP_TITLE,
+            "generated_date": generated_date,
+            "model_used": model_used,
+            "analysis": analysis_data,
+            "original_plan": markdown_plan,
+            "primary_color": PDF_THEME.get("primary_color", "#667eea"),
+            "secondary_color": PDF_THEME.get("secondary_color", "#764ba2"),
+        }
+    
+    def generate_html_report(self, 
+                            analysis_data: Dict[str, Any], 
+                            markdown_plan: str, 
+                            model_used: str,
+                            timestamps: Optional[Tuple[str, str]] = None) -> str:
+        """Generate an HTML report of the architecture analysis.
+        
+        Args:
+            analysis_data: The analysis data dictionary
+            markdown_plan: The original architecture plan
+            model_used: The model used for analysis
+            timestamps: (filename, display) timestamps from _now_strings(); the current time if omitted
+            
+        Returns:
+            Path to the generated HTML file
+        """
+        filename_ts, display_ts = timestamps or _now_strings()
+        output_path = self._generate_filename("architecture_analysis", "html", filename_ts)
         
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(md_content))
+        # Stream the rendered template straight into the file, without building the whole page in memory
+        template = self.jinja_env.get_template('report_template.html')
+        stream = template.stream(**self._template_context(analysis_data, markdown_plan, model_used, display_ts))
+        with open(output_path, 'wb', buffering=HTML_WRITE_BUFFER_SIZE) as f:
+            stream.dump(f, encoding='utf-8')
+        
+        logger.info(f"Generated HTML report: {output_path}")
+        return output_path
+
+    def generate_markdown_report(self, 
+                               analysis_data: Dict[str, Any], 
+                               markdown_plan: str, 
+                               model_used: str,
+                               timestamps: Optional[Tuple[str, str]] = None) -> str:
+        """Generate a Markdown report of the architecture analysis.
+        
+        Args:
+            analysis_data: The analysis data dictionary
+            markdown_plan: The original architecture plan
+            model_used: The model used for analysis
+            timestamps: (filename, display) timestamps from _now_strings(); the current time if omitted
+            
+        Returns:
+            Path to the generated Markdown file
+        """
+        filename_ts, display_ts = timestamps or _now_strings()
+        output_path = self._generate_filename("architecture_analysis", "md", filename_ts)
+        
+        # Render template
+        template = self.jinja_env.get_template('report_template.md')
+        md_content = template.render(**self._template_context(analysis_data, markdown_plan, model_used, display_ts))
+        
+        # Write to file as UTF-8 in a single buffered write
+        with open(output_path, 'wb', buffering=MARKDOWN_WRITE_BUFFER_SIZE) as f:
+            f.write(md_content.encode('utf-8'))
         
         logger.info(f"Generated Markdown report: {output_path}")
         return output_path
@@ -627,14 +746,14 @@ class ExportManager:
         Returns:
             Base64 encoded PDF content
         """
-        pdf_path = self.generate_pdf_report(analysis_data, markdown_plan, model_used)
-        
-        # Read the PDF file and convert to base64
-        with open(pdf_path, 'rb') as pdf_file:
-            pdf_content = pdf_file.read()
-            base64_pdf = base64.b64encode(pdf_content).decode('utf-8')
-        
-        return base64_pdf
+        # Render in memory and encode in one pass, without a round-trip through disk
+        buffer = BytesIO()
+        self._build_pdf(buffer, analysis_data, markdown_plan, model_used, _now_strings()[1])
+        return base64.b64encode(buffer.getbuffer()).decode('ascii')
+
+
+# Translation table mapping characters that are unsafe in filenames to '_'
+_UNSAFE_FILENAME_CHARS = str.maketrans({char: '_' for char in '/\\:*?"<>|'})
 
 
 def sanitize_filename(filename: str) -> str:
@@ -647,12 +766,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Replace characters that are unsafe for filenames
-    unsafe_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-    for char in unsafe_chars:
-        filename = filename.replace(char, '_')
-    
-    return filename
+    # Replace characters that are unsafe for filenames in a single pass
+    return filename.translate(_UNSAFE_FILENAME_CHARS)
 
 # Export format constants
 PDF_FORMAT = "PDF"
@@ -0,0 +1,56 @@
+"""
+Process-wide asynchronous HTTP client shared by the LLM clients.
+"""
+
+from typing import Optional
+
+import httpx
+
+# Connection pool limits for the shared client
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+
+# Timeouts in seconds; reads get the long budget local models need
+HTTP_TIMEOUT = httpx.Timeout(connect=3.05, read=120.0, write=10.0, pool=5.0)
+
+# Retries for failed connection attempts
+HTTP_RETRIES = 3
+
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client, creating it on first use.
+
+    Returns:
+        The process-wide ``httpx.AsyncClient``
+    """
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                retries=HTTP_RETRIES,
+                limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS)
+            )
+        )
+    return _async_client
+
+
+async def prewarm(url: str) -> bool:
+    """
+    Open a keep-alive connection to a host ahead of the first real request.
+
+    Args:
+        url: Any cheap endpoint on the host, requested with HEAD
+
+    Returns:
+        True if the host answered, False if it could not be reached
+    """
+    try:
+        await get_async_client().head(url)
+    except httpx.HTTPError:
+        return False
+    return True
@@ -0,0 +1,174 @@
+"""
+Response and analysis caches for LLM analysis calls.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from config import CACHE_MAX_TEMPERATURE
+from core_logic import PlanAnalysisCache
+
+
+class LLMCache:
+    """
+    TTL + LRU cache of raw LLM responses keyed by model, plan and temperature.
+
+    Safe to share between threads: the synchronous client calls may run on
+    worker threads while the async ones use the event loop.
+
+    Only low-temperature calls are cached: with more sampling the same request
+    may legitimately produce a different analysis, so calls above
+    ``CACHE_MAX_TEMPERATURE`` bypass the cache.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0, max_temperature: float = CACHE_MAX_TEMPERATURE):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses to keep
+            ttl: Seconds a response stays valid after it is stored
+            max_temperature: Highest sampling temperature whose responses are cached
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        # key -> (expiry time, response)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def cache_key(self, model: str, plan: str, temperature: float) -> Optional[str]:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model: The model the request is sent to
+            plan: The architecture plan in markdown format
+            temperature: The sampling temperature of the request
+
+        Returns:
+            SHA-256 hex digest of the request, or None if the request is not cacheable
+        """
+        if temperature > self.max_temperature:
+            return None
+        request = json.dumps({"model": model, "plan": plan, "temperature": temperature}, sort_keys=True)
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from :meth:`cache_key`; None always misses
+
+        Returns:
+            The cached response, or None on a miss or expired entry
+        """
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def set(self, key: Optional[str], response: str) -> None:
+        """
+        Store a response, evicting the least recently used entry if full.
+
+        Args:
+            key: Key from :meth:`cache_key`; None is ignored
+            response: The raw response text to cache
+        """
+        if key is None or not response:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = {"hits": 0, "misses": 0}
+
+
+class SemanticCache:
+    """
+    Cache of parsed analyses, one :class:`PlanAnalysisCache` per model.
+
+    Lookups match the exact plan by default. Near-duplicate matching by
+    word-count cosine similarity is opt-in, for callers that present the hit
+    as a similar plan's analysis rather than as the result. Like
+    :class:`LLMCache`, only low-temperature requests are served.
+    """
+
+    def __init__(self, maxsize: int = 512, threshold: float = 0.92, max_temperature: float = CACHE_MAX_TEMPERATURE):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of analyses to keep per model
+            threshold: Minimum cosine similarity for a near-duplicate hit
+            max_temperature: Highest sampling temperature whose analyses are cached
+        """
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.max_temperature = max_temperature
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._models: Dict[str, PlanAnalysisCache] = {}
+
+    def get(self, model: str, plan: str, temperature: float,
+            near_duplicates: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Look up the analysis of the plan, or optionally a near-duplicate of it.
+
+        Args:
+            model: The model the request is sent to
+            plan: The architecture plan in markdown format
+            temperature: The sampling temperature of the request
+            near_duplicates: Also match cached plans above the similarity threshold
+
+        Returns:
+            The cached analysis, or None on a miss or an uncacheable request
+        """
+        if temperature > self.max_temperature:
+            return None
+        cache = self._models.get(model)
+        analysis = cache.get(plan, near_duplicates) if cache is not None else None
+        self.stats["hits" if analysis is not None else "misses"] += 1
+        return analysis
+
+    def put(self, model: str, plan: str, temperature: float, analysis_json: Dict[str, Any]) -> None:
+        """
+        Store the analysis of a plan.
+
+        Args:
+            model: The model the request was sent to
+            plan: The architecture plan in markdown format
+            temperature: The sampling temperature of the request
+            analysis_json: The parsed analysis for the plan
+        """
+        if temperature > self.max_temperature:
+            return
+        cache = self._models.get(model)
+        if cache is None:
+            cache = self._models[model] = PlanAnalysisCache(self.maxsize, self.threshold)
+        cache.put(plan, analysis_json)
+
+
+# Process-wide caches shared by all LLM clients
+RESPONSE_CACHE = LLMCache()
+ANALYSIS_CACHE = SemanticCache()
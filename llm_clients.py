@@ -2,14 +2,113 @@
 LLM client implementations for Google GenAI and LM Studio.
 """
 
-import json
+import asyncio
+import functools
+import threading
+import time
+import httpx
+import orjson
 import requests
-from typing import Dict, Any, List, Tuple
-from google import genai
-from google.genai import types
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 
-from config import GOOGLE_API_KEY, DEFAULT_LM_STUDIO_HOST
-from core_logic import ARCHITECT_SYSTEM_PROMPT
+from config import GOOGLE_API_KEY, DEFAULT_LM_STUDIO_HOST, LLM_TEMPERATURE
+from core_logic import get_request_builder
+from http_session import get_async_client, prewarm
+from llm_cache import LLMCache, RESPONSE_CACHE
+
+# Keep-alive connection pool sizing for the LM Studio HTTP session
+LM_STUDIO_POOL_CONNECTIONS = 4
+LM_STUDIO_POOL_MAXSIZE = 16
+
+# Seconds a host's model listing is reused before LM Studio is asked again
+LM_STUDIO_MODELS_TTL = 10.0
+
+# Timeouts in seconds; connecting gets its own short budget so a dead host fails fast
+LM_STUDIO_CONNECT_TIMEOUT = 3.05
+LM_STUDIO_TIMEOUT = 120.0  # 2 minute read timeout for local processing
+LM_STUDIO_MODELS_TIMEOUT = (LM_STUDIO_CONNECT_TIMEOUT, 5.0)
+LM_STUDIO_ANALYSIS_TIMEOUT = (LM_STUDIO_CONNECT_TIMEOUT, LM_STUDIO_TIMEOUT)
+
+# Bytes read per chunk when downloading a non-streamed completion
+LM_STUDIO_READ_CHUNK_SIZE = 16384
+
+# Retries for connection failures and transient gateway errors, with exponential backoff
+LM_STUDIO_RETRIES = 3
+LM_STUDIO_RETRY_BACKOFF = 0.5
+LM_STUDIO_RETRY_STATUSES = (502, 503, 504)
+
+
+# JSON schema LM Studio constrains the analysis output to, built once at import
+_JSON_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "summaryOfReviewerObservations": {
+            "type": "string",
+            "description": "A concise executive summary of the overall architectural strengths and key areas for focus"
+        },
+        "planSummary": {
+            "type": "string", 
+            "description": "Brief summary of what the system does as understood by Archimedes"
+        },
+        "strengths": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "dimension": {"type": "string"},
+                    "point": {"type": "string"},
+                    "reason": {"type": "string"}
+                },
+                "required": ["dimension", "point", "reason"]
+            }
+        },
+        "areasForImprovement": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "area": {"type": "string"},
+                    "concern": {"type": "string"},
+                    "suggestion": {"type": "string"},
+                    "severity": {"type": "string", "enum": ["CRITICAL", "HIGH", "MEDIUM", "LOW"]},
+                    "impact": {"type": "string"},
+                    "tradeOffsConsidered": {"type": "string"}
+                },
+                "required": ["area", "concern", "suggestion", "severity"]
+            }
+        },
+        "strategicRecommendations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "recommendation": {"type": "string"},
+                    "rationale": {"type": "string"},
+                    "potentialImplications": {"type": "string"}
+                },
+                "required": ["recommendation", "rationale"]
+            }
+        },
+        "nextStepsAndConsiderations": {
+            "type": "array",
+            "items": {"type": "string"}
+        }
+    },
+    "required": ["summaryOfReviewerObservations", "planSummary", "strengths", "areasForImprovement", "strategicRecommendations", "nextStepsAndConsiderations"]
+}
+
+_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "architecture_analysis",
+        "schema": _JSON_SCHEMA,
+        "strict": True
+    }
+}
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class LLMClientError(Exception):
@@ -17,27 +116,103 @@ class LLMClientError(Exception):
     pass
 
 
+@functools.cache
+def _genai() -> Any:
+    """Import the Google GenAI SDK on first use; it is slow to import and unused with LM Studio."""
+    from google import genai
+    return genai
+
+
+@functools.cache
+def _genai_types() -> Any:
+    """Import the Google GenAI request types on first use."""
+    from google.genai import types
+    return types
+
+
 class GoogleGenAIClient:
     """Client for Google GenAI API."""
     
-    def __init__(self):
+    def __init__(self, cache: LLMCache = RESPONSE_CACHE):
         """Initialize the Google GenAI client."""
-        self.client = None
-        self._initialize_client()
+        self._client: Optional[Any] = None
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self.cache = cache
+    
+    @property
+    def client(self) -> Optional[Any]:
+        """The SDK client, created (and the SDK imported) on first access."""
+        if not self._initialized:
+            self._initialize_client()
+        return self._client
     
     def _initialize_client(self):
         """Initialize the Google GenAI client with error handling."""
-        try:
-            self.client = genai.Client(api_key=GOOGLE_API_KEY)
-        except (ValueError, AssertionError) as e:
-            print(f"WARNING: Could not initialize Google GenAI Client. Google GenAI features will be disabled.")
-            print(f"Details: {e}")
-            self.client = None
+        with self._init_lock:
+            if self._initialized:
+                return
+            client = None
+            try:
+                # Route async calls through the shared connection pool when the SDK supports it
+                http_options = {}
+                if "httpx_async_client" in _genai_types().HttpOptions.model_fields:
+                    http_options["httpx_async_client"] = get_async_client()
+                client = _genai().Client(api_key=GOOGLE_API_KEY, http_options=http_options)
+            except (ImportError, AttributeError, ValueError, AssertionError) as e:
+                print(f"WARNING: Could not initialize Google GenAI Client. Google GenAI features will be disabled.")
+                print(f"Details: {e}")
+            self._client = client
+            self._initialized = True
     
     def is_available(self) -> bool:
         """Check if the client is available."""
         return self.client is not None
     
+    async def ais_available(self) -> bool:
+        """Check if the client is available, building it in a worker thread on first use."""
+        if not self._initialized:
+            await asyncio.to_thread(self._initialize_client)
+        return self._client is not None
+    
+    async def aprewarm(self) -> bool:
+        """
+        Load the SDK and open the TLS connection to Google before the first analysis.
+        
+        The SDK import runs in a worker thread so it does not stall the event
+        loop; a one-item model listing then establishes the connection.
+        
+        Returns:
+            True if Google answered, False if the client is unavailable or unreachable
+        """
+        if not await self.ais_available():
+            return False
+        client = self._client
+        try:
+            await client.aio.models.list(config={"page_size": 1})
+        except Exception:
+            return False
+        return True
+    
+    def _build_request(self, markdown_plan: str, model_choice: str) -> Dict[str, Any]:
+        """
+        Build the generate_content keyword arguments for an analysis.
+        
+        Args:
+            markdown_plan: The architecture plan to analyze
+            model_choice: The model to use for analysis
+            
+        Returns:
+            Keyword arguments for ``models.generate_content``
+        """
+        request = get_request_builder("Google GenAI")(markdown_plan)
+        config = _genai_types().GenerateContentConfig(
+            temperature=LLM_TEMPERATURE,
+            response_mime_type="application/json",
+            system_instruction=request["system_instruction"]
+        )
+        return {"model": f'models/{model_choice}', "contents": request["contents"], "config": config}
+    
     def generate_analysis(self, markdown_plan: str, model_choice: str) -> str:
         """
         Generate architecture analysis using Google GenAI.
@@ -55,33 +230,113 @@ class GoogleGenAIClient:
         if not self.client:
             raise LLMClientError("Google GenAI client not initialized. Please check your GOOGLE_API_KEY.")
         
+        key = self.cache.cache_key(f'models/{model_choice}', markdown_plan, LLM_TEMPERATURE)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            config = types.GenerateContentConfig(
-                temperature=0.2,
-                response_mime_type="application/json",
-                system_instruction=ARCHITECT_SYSTEM_PROMPT
-            )
-            
-            full_prompt = f"Please analyze this architecture plan:\n\n{markdown_plan}"
+            response = self.client.models.generate_content(**self._build_request(markdown_plan, model_choice))
+        except Exception as e:
+            raise LLMClientError(f"Google GenAI API error: {str(e)}")
+        
+        text = response.text or ""
+        self.cache.set(key, text)
+        return text
+    
+    async def agenerate_analysis(self, markdown_plan: str, model_choice: str) -> str:
+        """
+        Generate architecture analysis using Google GenAI without blocking the event loop.
+        
+        Args:
+            markdown_plan: The architecture plan to analyze
+            model_choice: The model to use for analysis
             
-            response = self.client.models.generate_content(
-                model=f'models/{model_choice}',
-                contents=full_prompt,
-                config=config
-            )
+        Returns:
+            JSON response as string
             
-            return response.text or ""
+        Raises:
+            LLMClientError: If the client is not available or API call fails
+        """
+        if not self.client:
+            raise LLMClientError("Google GenAI client not initialized. Please check your GOOGLE_API_KEY.")
+        
+        key = self.cache.cache_key(f'models/{model_choice}', markdown_plan, LLM_TEMPERATURE)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await self.client.aio.models.generate_content(**self._build_request(markdown_plan, model_choice))
+        except Exception as e:
+            raise LLMClientError(f"Google GenAI API error: {str(e)}")
+        
+        text = response.text or ""
+        self.cache.set(key, text)
+        return text
+
+    async def astream_analysis(self, markdown_plan: str, model_choice: str) -> AsyncIterator[str]:
+        """
+        Stream an architecture analysis from Google GenAI as it is generated.
+
+        Args:
+            markdown_plan: The architecture plan to analyze
+            model_choice: The model to use for analysis
+
+        Yields:
+            Fragments of the JSON response, in arrival order
+
+        Raises:
+            LLMClientError: If the client is not available or API call fails
+        """
+        if not self.client:
+            raise LLMClientError("Google GenAI client not initialized. Please check your GOOGLE_API_KEY.")
+
+        key = self.cache.cache_key(f'models/{model_choice}', markdown_plan, LLM_TEMPERATURE)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        parts: List[str] = []
+        try:
+            stream = await self.client.aio.models.generate_content_stream(**self._build_request(markdown_plan, model_choice))
+            async for chunk in stream:
+                if chunk.text:
+                    parts.append(chunk.text)
+                    yield chunk.text
         except Exception as e:
             raise LLMClientError(f"Google GenAI API error: {str(e)}")
 
+        self.cache.set(key, "".join(parts))
+
 
 class LMStudioClient:
     """Client for LM Studio local API."""
     
-    def __init__(self, host: str = DEFAULT_LM_STUDIO_HOST):
+    def __init__(self, host: str = DEFAULT_LM_STUDIO_HOST, cache: LLMCache = RESPONSE_CACHE):
         """Initialize the LM Studio client."""
         self.host = host
+        self.cache = cache
         self.base_url = self._get_base_url(host)
+        self.session = self._create_session()
+        # host -> (fetch time, model ids); entries are per host, so switching hosts needs no invalidation
+        self._models_cache: Dict[str, Tuple[float, List[str]]] = {}
+    
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session that keeps connections to the LM Studio host alive."""
+        session = requests.Session()
+        retry = Retry(
+            total=LM_STUDIO_RETRIES,
+            backoff_factor=LM_STUDIO_RETRY_BACKOFF,
+            status_forcelist=LM_STUDIO_RETRY_STATUSES,
+            allowed_methods=["GET", "POST"],
+            raise_on_status=False  # Hand the last error response back for normal handling
+        )
+        adapter = HTTPAdapter(pool_connections=LM_STUDIO_POOL_CONNECTIONS, pool_maxsize=LM_STUDIO_POOL_MAXSIZE,
+                              max_retries=retry)
+        session.mount(self.base_url, adapter)
+        return session
     
     def _get_base_url(self, host: str) -> str:
         """Construct the LM Studio base URL from host."""
@@ -93,8 +348,19 @@ class LMStudioClient:
     
     def update_host(self, host: str):
         """Update the host and base URL."""
+        self.session.close()
         self.host = host
         self.base_url = self._get_base_url(host)
+        self.session = self._create_session()
+    
+    async def aprewarm(self) -> bool:
+        """
+        Open a keep-alive connection to LM Studio before the first analysis.
+        
+        Returns:
+            True if LM Studio answered, False if it could not be reached
+        """
+        return await prewarm(f"{self.base_url}/models")
     
     def test_connection(self) -> Tuple[bool, str]:
         """
@@ -104,10 +370,11 @@ class LMStudioClient:
             Tuple of (is_connected, status_message)
         """
         try:
-            response = requests.get(f"{self.base_url}/models", timeout=5)
+            response = self.session.get(f"{self.base_url}/models", timeout=LM_STUDIO_MODELS_TIMEOUT)
             if response.status_code == 200:
-                models = response.json()
+                models = orjson.loads(response.content)
                 model_count = len(models.get("data", []))
+                self._models_cache[self.host] = (time.monotonic(), [model["id"] for model in models.get("data", [])])
                 return True, f"✅ Connected successfully. Found {model_count} models."
             else:
                 return False, f"❌ Connection failed: HTTP {response.status_code}"
@@ -118,23 +385,60 @@ class LMStudioClient:
         except Exception as e:
             return False, f"❌ Error: {str(e)}"
     
-    def get_available_models(self) -> List[str]:
+    def get_available_models(self, refresh: bool = False) -> List[str]:
         """
         Get available models from LM Studio.
         
+        Listings are cached per host for ``LM_STUDIO_MODELS_TTL`` seconds, so
+        bursts of UI events do not each cost a network round-trip.
+        
+        Args:
+            refresh: Bypass the cache and fetch a fresh listing
+        
         Returns:
             List of available model names
         """
+        now = time.monotonic()
+        entry = self._models_cache.get(self.host)
+        if not refresh and entry and now - entry[0] < LM_STUDIO_MODELS_TTL:
+            return entry[1]
+        
         try:
-            response = requests.get(f"{self.base_url}/models", timeout=5)
+            response = self.session.get(f"{self.base_url}/models", timeout=LM_STUDIO_MODELS_TIMEOUT)
             if response.status_code == 200:
-                models = response.json()
-                return [model["id"] for model in models.get("data", [])]
+                models = orjson.loads(response.content)
+                model_ids = [model["id"] for model in models.get("data", [])]
+                self._models_cache[self.host] = (now, model_ids)
+                return model_ids
             else:
                 return ["local-model"]  # Fallback
         except:
             return ["local-model"]  # Fallback if LM Studio is not running
     
+    def _build_payload(self, markdown_plan: str, model_choice: str, stream: bool = False) -> bytes:
+        """
+        Build the chat completion request body for an analysis.
+        
+        Args:
+            markdown_plan: The architecture plan to analyze
+            model_choice: The model to use for analysis
+            stream: Whether to request the completion as server-sent events
+            
+        Returns:
+            The serialized JSON payload for the chat completions endpoint
+        """
+        # Format the prompt for chat completion
+        messages = get_request_builder("LM Studio (Local)")(markdown_plan)["messages"]
+        
+        payload: Dict[str, Any] = {
+            "model": model_choice,
+            "messages": messages,
+            "temperature": LLM_TEMPERATURE,
+            "stream": stream,
+            "response_format": _RESPONSE_FORMAT
+        }
+        return orjson.dumps(payload)
+    
     def generate_analysis(self, markdown_plan: str, model_choice: str) -> str:
         """
         Generate architecture analysis using LM Studio.
@@ -149,121 +453,148 @@ class LMStudioClient:
         Raises:
             LLMClientError: If the API call fails
         """
+        key = self.cache.cache_key(f"{self.base_url}/{model_choice}", markdown_plan, LLM_TEMPERATURE)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            headers = {
-                "Content-Type": "application/json"
-            }
+            with self.session.post(
+                f"{self.base_url}/chat/completions",
+                headers=_JSON_HEADERS,
+                data=self._build_payload(markdown_plan, model_choice),
+                timeout=LM_STUDIO_ANALYSIS_TIMEOUT,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    raise LLMClientError(f"LM Studio API error: {response.status_code} - {response.text}")
+                
+                # Receive the body in chunks into one buffer and parse it in place
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=LM_STUDIO_READ_CHUNK_SIZE):
+                    body.extend(chunk)
             
-            # Format the prompt for chat completion
-            messages = [
-                {"role": "system", "content": ARCHITECT_SYSTEM_PROMPT},
-                {"role": "user", "content": f"Please analyze this architecture plan:\n\n{markdown_plan}"}
-            ]
+            result = orjson.loads(body)
+            content = result["choices"][0]["message"]["content"]
+            self.cache.set(key, content)
+            return content
+                
+        except requests.exceptions.ConnectionError:
+            raise LLMClientError(f"Cannot connect to LM Studio at {self.host}. Please ensure LM Studio is running.")
+        except requests.exceptions.Timeout:
+            raise LLMClientError("LM Studio request timed out. The model might be too slow or the request too complex.")
+        except Exception as e:
+            raise LLMClientError(f"LM Studio API error: {str(e)}")
+    
+    async def agenerate_analysis(self, markdown_plan: str, model_choice: str) -> str:
+        """
+        Generate architecture analysis using LM Studio without blocking the event loop.
+        
+        Args:
+            markdown_plan: The architecture plan to analyze
+            model_choice: The model to use for analysis
             
-            # Define the JSON schema for the expected response format
-            json_schema = {
-                "type": "object",
-                "properties": {
-                    "summaryOfReviewerObservations": {
-                        "type": "string",
-                        "description": "A concise executive summary of the overall architectural strengths and key areas for focus"
-                    },
-                    "planSummary": {
-                        "type": "string", 
-                        "description": "Brief summary of what the system does as understood by Archimedes"
-                    },
-                    "strengths": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "dimension": {"type": "string"},
-                                "point": {"type": "string"},
-                                "reason": {"type": "string"}
-                            },
-                            "required": ["dimension", "point", "reason"]
-                        }
-                    },
-                    "areasForImprovement": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "area": {"type": "string"},
-                                "concern": {"type": "string"},
-                                "suggestion": {"type": "string"},
-                                "severity": {"type": "string", "enum": ["CRITICAL", "HIGH", "MEDIUM", "LOW"]},
-                                "impact": {"type": "string"},
-                                "tradeOffsConsidered": {"type": "string"}
-                            },
-                            "required": ["area", "concern", "suggestion", "severity"]
-                        }
-                    },
-                    "strategicRecommendations": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "recommendation": {"type": "string"},
-                                "rationale": {"type": "string"},
-                                "potentialImplications": {"type": "string"}
-                            },
-                            "required": ["recommendation", "rationale"]
-                        }
-                    },
-                    "nextStepsAndConsiderations": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    }
-                },
-                "required": ["summaryOfReviewerObservations", "planSummary", "strengths", "areasForImprovement", "strategicRecommendations", "nextStepsAndConsiderations"]
-            }
-
-            payload: Dict[str, Any] = {
-                "model": model_choice,
-                "messages": messages,
-                "temperature": 0.2,
-                "stream": False,
-                "response_format": {
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "architecture_analysis",
-                        "schema": json_schema,
-                        "strict": True
-                    }
-                }
-            }
+        Returns:
+            JSON response as string
             
-            response = requests.post(
+        Raises:
+            LLMClientError: If the API call fails
+        """
+        key = self.cache.cache_key(f"{self.base_url}/{model_choice}", markdown_plan, LLM_TEMPERATURE)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            # Fetched per request: the shared client is recreated if it was closed
+            response = await get_async_client().post(
                 f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=payload,
-                timeout=120  # 2 minute timeout for local processing
+                headers=_JSON_HEADERS,
+                content=self._build_payload(markdown_plan, model_choice)
             )
             
             if response.status_code == 200:
-                result = response.json()
-                return result["choices"][0]["message"]["content"]
+                result = orjson.loads(response.content)
+                content = result["choices"][0]["message"]["content"]
+                self.cache.set(key, content)
+                return content
             else:
                 raise LLMClientError(f"LM Studio API error: {response.status_code} - {response.text}")
                 
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             raise LLMClientError(f"Cannot connect to LM Studio at {self.host}. Please ensure LM Studio is running.")
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             raise LLMClientError("LM Studio request timed out. The model might be too slow or the request too complex.")
         except Exception as e:
             raise LLMClientError(f"LM Studio API error: {str(e)}")
+    
+    async def astream_analysis(self, markdown_plan: str, model_choice: str) -> AsyncIterator[str]:
+        """
+        Stream an architecture analysis from LM Studio as it is generated.
+        
+        The completion is requested with ``stream: true`` and the content
+        deltas of the server-sent events are yielded as they arrive, so callers
+        can show progress long before the full response is ready.
+        
+        Args:
+            markdown_plan: The architecture plan to analyze
+            model_choice: The model to use for analysis
+            
+        Yields:
+            Fragments of the JSON response, in arrival order
+            
+        Raises:
+            LLMClientError: If the API call fails
+        """
+        key = self.cache.cache_key(f"{self.base_url}/{model_choice}", markdown_plan, LLM_TEMPERATURE)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        parts: List[str] = []
+        try:
+            async with get_async_client().stream(
+                "POST",
+                f"{self.base_url}/chat/completions",
+                headers=_JSON_HEADERS,
+                content=self._build_payload(markdown_plan, model_choice, stream=True)
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise LLMClientError(f"LM Studio API error: {response.status_code} - {response.text}")
+                
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    choices = orjson.loads(data).get("choices") or [{}]
+                    delta = (choices[0].get("delta") or {}).get("content")
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+                    
+        except LLMClientError:
+            raise
+        except httpx.ConnectError:
+            raise LLMClientError(f"Cannot connect to LM Studio at {self.host}. Please ensure LM Studio is running.")
+        except httpx.TimeoutException:
+            raise LLMClientError("LM Studio request timed out. The model might be too slow or the request too complex.")
+        except Exception as e:
+            raise LLMClientError(f"LM Studio API error: {str(e)}")
+        
+        self.cache.set(key, "".join(parts))
 
 
-class LLMClientFactory:
-    """Factory for creating LLM clients."""
-    
-    @staticmethod
-    def create_google_client() -> GoogleGenAIClient:
-        """Create a Google GenAI client."""
-        return GoogleGenAIClient()
-    
-    @staticmethod
-    def create_lm_studio_client(host: str = DEFAULT_LM_STUDIO_HOST) -> LMStudioClient:
-        """Create an LM Studio client."""
-        return LMStudioClient(host)
+@functools.cache
+def google_client() -> GoogleGenAIClient:
+    """Get the process-wide Google GenAI client, creating it on first use."""
+    return GoogleGenAIClient()
+
+
+@functools.cache
+def lm_studio_client() -> LMStudioClient:
+    """Get the process-wide LM Studio client, creating it on first use."""
+    return LMStudioClient()
@@ -2,26 +2,130 @@
 Main application entry point for VelocityAI - A Systems Architect Toolset.
 """
 
-import os
+import asyncio
+import functools
+import html
+import inspect
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 import gradio as gr
-import bleach
-from typing import Generator, List, Dict, Any, Optional, Tuple
+from typing import AsyncGenerator, Callable, List, Dict, Any, FrozenSet, Optional, Tuple, Union
 
 from config import (APP_HOST, APP_PORT, GEMINI_FLASH, GEMINI_PRO, 
-                   DEFAULT_LM_STUDIO_HOST, EXPORT_FORMATS, DEFAULT_EXPORT_FORMAT)
+                   DEFAULT_LM_STUDIO_HOST, EXPORT_FORMATS, DEFAULT_EXPORT_FORMAT, LLM_TEMPERATURE,
+                   MAX_PLAN_CHARS, ENABLE_EXPORT)
 from core_logic import validate_input, parse_analysis_response, format_analysis_response
-from llm_clients import LLMClientFactory, LLMClientError
+from llm_cache import ANALYSIS_CACHE
+from llm_clients import GoogleGenAIClient, LLMClientError, LMStudioClient, google_client, lm_studio_client
 from ui_components import UIComponents, create_gradio_interface
 from export_utils import ExportManager
 
+# Number of distinct sanitized outputs kept in memory
+SANITIZE_CACHE_SIZE = 512
 
+# Exports that can be generated at the same time
+EXPORT_WORKERS = 2
+
+# Export formats offered in the UI, as a set for O(1) membership checks
+_EXPORT_FORMAT_SET = frozenset(EXPORT_FORMATS)
+
+# Characters of an unparseable response shown before and after the cut
+RAW_RESPONSE_HEAD_CHARS = 2048
+RAW_RESPONSE_TAIL_CHARS = 1024
+
+# HTML embedding a base64-encoded PDF for the export preview
+_PDF_PREVIEW_TEMPLATE = """
+<div style="text-align: center;">
+    <h3>PDF Preview</h3>
+    <embed src="data:application/pdf;base64,{base64_pdf}" width="100%" height="600px" type="application/pdf">
+    <p>If the preview doesn't work, you can export the PDF using the export button.</p>
+</div>
+"""
+
+# Characters of streamed LM Studio output between progress updates
+STREAM_PROGRESS_CHARS = 500
+
+# Allowed HTML tags for markdown formatting
+_ALLOWED_TAGS = frozenset({
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',  # Headers
+    'p', 'br', 'hr',                       # Paragraphs and breaks
+    'strong', 'b', 'em', 'i', 'u', 's',   # Text formatting
+    'ul', 'ol', 'li',                      # Lists
+    'blockquote', 'pre', 'code',           # Code and quotes
+    'table', 'thead', 'tbody', 'tr', 'th', 'td',  # Tables
+    'a',                                   # Links (with limited attributes)
+})
+
+# Opening of an <a> tag with attributes, in bleach's normalized output
+_ANCHOR_OPEN = re.compile(r"<a\s+")
+
+# Allowed attributes for specific tags (a plain dict, as nh3 requires, but never mutated)
+_ALLOWED_ATTRIBUTES: Dict[str, FrozenSet[str]] = {
+    'a': frozenset({'href', 'title'}),
+    'code': frozenset({'class'}),  # For syntax highlighting
+    'pre': frozenset({'class'}),   # For code blocks
+}
+
+
+@functools.cache
+def _load_sanitizer() -> Callable[[str], str]:
+    """
+    Import the HTML sanitizer on first use rather than at startup.
+    
+    nh3 is preferred; if it is not installed, bleach is used with the same
+    allowlist, stripping disallowed tags and adding rel="nofollow" to links.
+    
+    Returns:
+        Function mapping raw content to sanitized content
+    """
+    try:
+        import nh3
+    except ImportError:
+        import bleach
+        
+        def clean(content: str) -> str:
+            cleaned = bleach.clean(content, tags=_ALLOWED_TAGS, attributes=_ALLOWED_ATTRIBUTES, strip=True)
+            # bleach normalizes markup and 'rel' is not an allowed attribute, so every
+            # remaining "<a " opens a real link without one; no second parse needed
+            return _ANCHOR_OPEN.sub('<a rel="nofollow" ', cleaned)
+        
+        return clean
+    
+    return functools.partial(
+        nh3.clean,
+        tags=_ALLOWED_TAGS,
+        attributes=_ALLOWED_ATTRIBUTES,
+        strip_comments=True,
+        link_rel="nofollow"
+    )
+
+
+def _truncate_middle(text: str) -> str:
+    """Shorten text to its first and last characters, marking the cut."""
+    if len(text) <= RAW_RESPONSE_HEAD_CHARS + RAW_RESPONSE_TAIL_CHARS:
+        return text
+    return f"{text[:RAW_RESPONSE_HEAD_CHARS]}\n...[truncated]...\n{text[-RAW_RESPONSE_TAIL_CHARS:]}"
+
+
+def _trusted(content: str) -> str:
+    """Pass through markdown authored by VelocityAI itself, which needs no sanitizing."""
+    return content
+
+
+def _escape(value: Any) -> str:
+    """Escape a value interpolated into trusted markdown so it cannot inject HTML."""
+    return html.escape(str(value), quote=False)
+
+
+@functools.lru_cache(maxsize=SANITIZE_CACHE_SIZE)
 def sanitize_markdown_output(content: str) -> str:
     """
     Sanitize markdown content to prevent XSS attacks.
     
     This function removes potentially dangerous HTML tags and attributes
-    while preserving safe markdown formatting.
+    while preserving safe markdown formatting. It is reserved for untrusted
+    LLM output; results are memoized, so repeated content is parsed once.
     
     Args:
         content (str): The raw markdown content from LLM
@@ -29,53 +133,76 @@ def sanitize_markdown_output(content: str) -> str:
     Returns:
         str: Sanitized markdown content safe for rendering
     """
-    # Define allowed HTML tags for markdown formatting
-    allowed_tags = [
-        'h1', 'h2', 'h3', 'h4', 'h5', 'h6',  # Headers
-        'p', 'br', 'hr',                       # Paragraphs and breaks
-        'strong', 'b', 'em', 'i', 'u', 's',   # Text formatting
-        'ul', 'ol', 'li',                      # Lists
-        'blockquote', 'pre', 'code',           # Code and quotes
-        'table', 'thead', 'tbody', 'tr', 'th', 'td',  # Tables
-        'a',                                   # Links (with limited attributes)
-    ]
-    
-    # Define allowed attributes for specific tags
-    allowed_attributes = {
-        'a': ['href', 'title'],
-        'code': ['class'],  # For syntax highlighting
-        'pre': ['class'],   # For code blocks
-    }
-    
-    # Sanitize the content
-    cleaned_content = bleach.clean(
-        content,
-        tags=allowed_tags,
-        attributes=allowed_attributes,
-        strip=True  # Remove disallowed tags completely
-    )
-    
-    # Additional protection: ensure URLs in links are safe
-    cleaned_content = bleach.linkify(
-        cleaned_content,
-        callbacks=[bleach.callbacks.nofollow]  # Add rel="nofollow" to external links
-    )
+    # Sanitize the content: disallowed tags are removed, unsafe URL schemes are
+    # dropped and every link gets rel="nofollow"
+    return _load_sanitizer()(content)
+
+
+def _analysis_cache_model(provider: str, model_choice: str, lm_studio_host: str) -> str:
+    """Name the analysis cache partition for a provider's model."""
+    # LM Studio servers may expose the same model name, so their models are keyed by host
+    if provider == "LM Studio (Local)":
+        return f"{provider}/{lm_studio_host}/{model_choice}"
+    return f"{provider}/{model_choice}"
+
+
+def _with_lm_studio_host(param: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Point the LM Studio client at a method's host argument before the method runs.
     
-    return cleaned_content
+    Args:
+        param: Name of the parameter holding the host
+        
+    Returns:
+        Decorator for ArchitectureAnalyzer methods
+    """
+    def decorator(method: Callable[..., Any]) -> Callable[..., Any]:
+        # Resolve where the host argument lives once, not on every call
+        parameters = inspect.signature(method).parameters
+        default = parameters[param].default
+        position = list(parameters).index(param) - 1  # Excluding self
+        
+        @functools.wraps(method)
+        def wrapper(self: "ArchitectureAnalyzer", *args: Any, **kwargs: Any) -> Any:
+            if param in kwargs:
+                host = kwargs[param]
+            elif position < len(args):
+                host = args[position]
+            else:
+                host = default
+            self._use_lm_studio_host(host)
+            return method(self, *args, **kwargs)
+        
+        return wrapper
+    return decorator
 
 
 class ArchitectureAnalyzer:
     """Main application class for architecture analysis."""
     
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ("google_client", "lm_studio_client", "ui", "export_manager", "analysis_cache",
+                 "last_analysis_result", "_preview_cache", "_provider_dispatch", "_export_pool")
+    
     def __init__(self):
         """Initialize the application."""
-        self.google_client = LLMClientFactory.create_google_client()
-        self.lm_studio_client = LLMClientFactory.create_lm_studio_client()
+        self.google_client = google_client()
+        self.lm_studio_client = lm_studio_client()
         self.ui = UIComponents()
-        self.export_manager = ExportManager()
+        self.export_manager = ExportManager() if ENABLE_EXPORT else None
+        # Report generation is CPU-bound, so it runs on its own small pool
+        self._export_pool = ThreadPoolExecutor(max_workers=EXPORT_WORKERS) if ENABLE_EXPORT else None
+        self.analysis_cache = ANALYSIS_CACHE
         self.last_analysis_result = None  # Store the last analysis result for export
+        # (id of last_analysis_result, format) -> rendered preview
+        self._preview_cache: Dict[Tuple[int, str], str] = {}
+        # Provider name -> method returning the client ready to analyze with
+        self._provider_dispatch: Dict[str, Callable[[str], Union[GoogleGenAIClient, LMStudioClient]]] = {
+            "Google GenAI": self._prepare_google_client,
+            "LM Studio (Local)": self._prepare_lm_studio_client,
+        }
     
-    def analyze_architecture(self, markdown_plan: str, model_choice: str, provider: str, lm_studio_host: str = DEFAULT_LM_STUDIO_HOST) -> Generator[str, None, None]:
+    async def analyze_architecture(self, markdown_plan: str, model_choice: str, provider: str, lm_studio_host: str = DEFAULT_LM_STUDIO_HOST) -> AsyncGenerator[str, None]:
         """
         Analyze the architecture plan using the selected provider.
         
@@ -90,70 +217,238 @@ class ArchitectureAnalyzer:
         """
         if not validate_input(markdown_plan):
             gr.Warning("Please enter an architecture plan to analyze.")
-            yield sanitize_markdown_output("Please enter an architecture plan to analyze.")
+            yield _trusted("Please enter an architecture plan to analyze.")
+            return
+        if len(markdown_plan) > MAX_PLAN_CHARS:
+            gr.Warning("The architecture plan is too large to analyze.")
+            yield _trusted(f"**Error:** The plan is {len(markdown_plan):,} characters long; the limit is {MAX_PLAN_CHARS:,}. Please split it into smaller plans.")
             return
 
         # Show loading message
-        yield sanitize_markdown_output(f"🤖 Analyzing your plan with {model_choice} via {provider}...")
+        yield _trusted(f"🤖 Analyzing your plan with {_escape(model_choice)} via {_escape(provider)}...")
 
         response_text = ""  # Initialize to avoid unbound variable issues
         self.last_analysis_result = None  # Reset last analysis result
+        self._preview_cache.clear()  # Previews of the previous result are stale
         
         try:
-            # Get the appropriate client and generate analysis
-            if provider == "Google GenAI":
-                if not self.google_client.is_available():
-                    yield sanitize_markdown_output("**Error:** Google GenAI client not available. Please check your API key.")
+            # Reuse the analysis of an identical plan, if any. Near-duplicates are not
+            # reused: a changed number or negation can call for a different analysis.
+            cache_model = _analysis_cache_model(provider, model_choice, lm_studio_host)
+            analysis_json = self.analysis_cache.get(cache_model, markdown_plan, LLM_TEMPERATURE)
+            if analysis_json is None:
+                # Get the appropriate client
+                prepare_client = self._provider_dispatch.get(provider)
+                if prepare_client is None:
+                    yield _trusted(f"**Error:** Unknown provider: {_escape(provider)}")
                     return
-                response_text = self.google_client.generate_analysis(markdown_plan, model_choice)
-            elif provider == "LM Studio (Local)":
-                # Update host if it has changed
-                if lm_studio_host != self.lm_studio_client.host:
-                    self.lm_studio_client.update_host(lm_studio_host)
-                response_text = self.lm_studio_client.generate_analysis(markdown_plan, model_choice)
-            else:
-                yield sanitize_markdown_output(f"**Error:** Unknown provider: {provider}")
-                return
+                if provider == "Google GenAI":
+                    # Import and build the SDK client off the event loop if prewarming has not yet
+                    await self.google_client.ais_available()
+                client = prepare_client(lm_studio_host)
 
-            # Parse and format the response
-            analysis_json = parse_analysis_response(response_text)
+                # Stream the response, reporting progress as it arrives
+                chunks: List[str] = []
+                received = reported = 0
+                async for chunk in client.astream_analysis(markdown_plan, model_choice):
+                    chunks.append(chunk)
+                    received += len(chunk)
+                    if received - reported >= STREAM_PROGRESS_CHARS:
+                        reported = received
+                        yield _trusted(f"🤖 Analyzing your plan with {_escape(model_choice)} via {_escape(provider)}... ({received:,} characters received)")
+                response_text = "".join(chunks)
+
+                analysis_json = parse_analysis_response(response_text)
+                self.analysis_cache.put(cache_model, markdown_plan, LLM_TEMPERATURE, analysis_json)
+            
             formatted_output = format_analysis_response(analysis_json, model_choice)
             
             # Store the analysis results and original plan for export
-            self.last_analysis_result = {
-                "analysis_data": analysis_json,
-                "markdown_plan": markdown_plan,
-                "model_used": model_choice
-            }
+            if ENABLE_EXPORT:
+                self.last_analysis_result = {
+                    "analysis_data": analysis_json,
+                    "markdown_plan": markdown_plan,
+                    "model_used": model_choice
+                }
             
-            yield sanitize_markdown_output(formatted_output)
+            # Large, never-seen-before content: sanitize off the event loop
+            yield await asyncio.to_thread(sanitize_markdown_output, formatted_output)
 
         except json.JSONDecodeError:
             gr.Error("The AI returned an invalid JSON response. This can happen with complex inputs.")
-            yield sanitize_markdown_output(f"**Error:** The AI response could not be parsed as JSON. Please try a slightly different input or a more powerful model.\n\n**Raw Response:**\n```\n{response_text}\n```")
+            # Only a bounded head and tail is shown, so sanitizing stays cheap however long the response
+            yield sanitize_markdown_output(f"**Error:** The AI response could not be parsed as JSON. Please try a slightly different input or a more powerful model.\n\n**Raw Response:**\n```\n{_truncate_middle(response_text)}\n```")
         except LLMClientError as e:
             gr.Error(f"LLM Client error: {str(e)}")
-            yield sanitize_markdown_output(f"**Error:** {str(e)}")
+            yield _trusted(f"**Error:** {_escape(e)}")
         except Exception as e:
             gr.Error(f"An unexpected error occurred: {str(e)}")
-            yield sanitize_markdown_output(f"**Error:** An unexpected error occurred: {str(e)}")
+            yield _trusted(f"**Error:** An unexpected error occurred: {_escape(e)}")
     
-    def test_lm_studio_connection(self, host: str) -> str:
-        """Test connection to LM Studio."""
-        # Update host if it has changed
-        if host != self.lm_studio_client.host:
-            self.lm_studio_client.update_host(host)
+    async def analyze_and_clear_export(self, markdown_plan: str, model_choice: str, provider: str,
+                                       lm_studio_host: str = DEFAULT_LM_STUDIO_HOST) -> AsyncGenerator[Tuple[str, Any], None]:
+        """
+        Run :meth:`analyze_architecture` and hide the previous export result in the same event.
         
-        _, message = self.lm_studio_client.test_connection()
-        return sanitize_markdown_output(message)
+        Args:
+            markdown_plan: The architecture plan in markdown format
+            model_choice: The model to use for analysis
+            provider: The provider to use ("Google GenAI" or "LM Studio (Local)")
+            lm_studio_host: The LM Studio host (for local provider)
+            
+        Yields:
+            (analysis output, export result update) pairs; the export result is only cleared once
+        """
+        export_update: Any = gr.HTML(value="", visible=False)
+        async for output in self.analyze_architecture(markdown_plan, model_choice, provider, lm_studio_host):
+            yield output, export_update
+            export_update = gr.skip()
+    
+    def _prepare_google_client(self, lm_studio_host: str) -> GoogleGenAIClient:
+        """
+        Get the Google GenAI client for an analysis.
+        
+        Args:
+            lm_studio_host: Unused; accepted so all providers share one signature
+            
+        Returns:
+            The Google GenAI client
+            
+        Raises:
+            LLMClientError: If the client is not available
+        """
+        if not self.google_client.is_available():
+            raise LLMClientError("Google GenAI client not available. Please check your API key.")
+        return self.google_client
+    
+    @_with_lm_studio_host("lm_studio_host")
+    def _prepare_lm_studio_client(self, lm_studio_host: str) -> LMStudioClient:
+        """
+        Get the LM Studio client for an analysis, pointed at the given host.
+        
+        Args:
+            lm_studio_host: The LM Studio host to analyze with
+            
+        Returns:
+            The LM Studio client
+        """
+        return self.lm_studio_client
     
-    def get_lm_studio_models(self, host: str = DEFAULT_LM_STUDIO_HOST) -> List[str]:
-        """Get available models from LM Studio."""
-        # Update host if it has changed
+    def _use_lm_studio_host(self, host: str) -> None:
+        """Point the LM Studio client at a host, unless it already uses it."""
+        # The client is a process-wide singleton, so compare against its own host
         if host != self.lm_studio_client.host:
             self.lm_studio_client.update_host(host)
+    
+    def _get_client(self, provider: str) -> Union[GoogleGenAIClient, LMStudioClient]:
+        """
+        Look up the client for a provider.
+        
+        Args:
+            provider: The provider name ("Google GenAI" or "LM Studio (Local)")
+            
+        Returns:
+            The client serving that provider
+            
+        Raises:
+            LLMClientError: If the provider is unknown
+        """
+        prepare_client = self._provider_dispatch.get(provider)
+        if prepare_client is None:
+            raise LLMClientError(f"Unknown provider: {provider}")
+        return prepare_client(self.lm_studio_client.host)
+    
+    async def analyze_all(self, markdown_plan: str, models: List[Tuple[str, str]],
+                          return_exceptions: bool = False) -> AsyncGenerator[Tuple[str, str, Any], None]:
+        """
+        Analyze a plan with several providers and models concurrently.
+        
+        All requests are issued at once, so the batch takes as long as the
+        slowest model rather than the sum of all of them. Results are yielded
+        in completion order, fastest first.
+        
+        Args:
+            markdown_plan: The architecture plan in markdown format
+            models: (provider, model_choice) pairs to analyze the plan with
+            return_exceptions: Yield a failed analysis' exception in place of its result
+                instead of raising it, so the other analyses still complete
+            
+        Yields:
+            (provider, model_choice, analysis_json) for each completed analysis
+            
+        Raises:
+            LLMClientError: If a provider is unknown or its API call fails
+            json.JSONDecodeError: If a response is not valid JSON
+        """
+        async def analyze_one(provider: str, model_choice: str) -> Tuple[str, str, Any]:
+            try:
+                if provider == "Google GenAI":
+                    await self.google_client.ais_available()  # Builds the SDK client off the event loop
+                response_text = await self._get_client(provider).agenerate_analysis(markdown_plan, model_choice)
+                return provider, model_choice, parse_analysis_response(response_text)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return provider, model_choice, e
+        
+        for result in asyncio.as_completed([analyze_one(provider, model) for provider, model in models]):
+            yield await result
+    
+    async def compare_models(self, markdown_plan: str, lm_studio_host: str = DEFAULT_LM_STUDIO_HOST) -> AsyncGenerator[str, None]:
+        """
+        Analyze the plan with both Gemini models and the current LM Studio model side by side.
+        
+        Args:
+            markdown_plan: The architecture plan in markdown format
+            lm_studio_host: The LM Studio host (for local provider)
+            
+        Yields:
+            Status messages, then the comparison growing as each analysis completes
+        """
+        if not validate_input(markdown_plan):
+            gr.Warning("Please enter an architecture plan to analyze.")
+            yield _trusted("Please enter an architecture plan to analyze.")
+            return
+        if len(markdown_plan) > MAX_PLAN_CHARS:
+            gr.Warning("The architecture plan is too large to analyze.")
+            yield _trusted(f"**Error:** The plan is {len(markdown_plan):,} characters long; the limit is {MAX_PLAN_CHARS:,}. Please split it into smaller plans.")
+            return
+        
+        models: List[Tuple[str, str]] = []
+        if await self.google_client.ais_available():
+            models += [("Google GenAI", GEMINI_FLASH), ("Google GenAI", GEMINI_PRO)]
+        lm_studio_models = await asyncio.to_thread(self.get_lm_studio_models, lm_studio_host)
+        if lm_studio_models and lm_studio_models != ["local-model"]:
+            models.append(("LM Studio (Local)", lm_studio_models[0]))
+        if not models:
+            yield _trusted("**Error:** No models available to compare. Check your API key or LM Studio connection.")
+            return
+        
+        names = ", ".join(model for _, model in models)
+        yield _trusted(f"🤖 Comparing {len(models)} models: {_escape(names)}...")
         
-        return self.lm_studio_client.get_available_models()
+        sections: List[str] = []
+        async for provider, model_choice, result in self.analyze_all(markdown_plan, models, return_exceptions=True):
+            if isinstance(result, Exception):
+                sections.append(f"## ❌ {model_choice} via {provider}\n\n**Error:** {str(result)}")
+            else:
+                sections.append(format_analysis_response(result, model_choice))
+            yield await asyncio.to_thread(sanitize_markdown_output, "\n\n---\n\n".join(sections))
+    
+    async def prewarm_connections(self) -> None:
+        """Open keep-alive connections to both providers when the UI loads, ahead of the first analysis."""
+        await asyncio.gather(self.google_client.aprewarm(), self.lm_studio_client.aprewarm())
+    
+    @_with_lm_studio_host("host")
+    def test_lm_studio_connection(self, host: str) -> str:
+        """Test connection to LM Studio."""
+        _, message = self.lm_studio_client.test_connection()
+        return _trusted(_escape(message))
+    
+    @_with_lm_studio_host("host")
+    def get_lm_studio_models(self, host: str = DEFAULT_LM_STUDIO_HOST, refresh: bool = False) -> List[str]:
+        """Get available models from LM Studio, from the short-lived cache unless refresh is set."""
+        return self.lm_studio_client.get_available_models(refresh)
     
     def update_model_choices(self, provider: str, host: str = DEFAULT_LM_STUDIO_HOST):
         """Update model choices based on provider selection."""
@@ -163,15 +458,15 @@ class ArchitectureAnalyzer:
             models = self.get_lm_studio_models(host)
             return self.ui.update_model_choices(provider, models)
     
-    def refresh_models_for_host(self, host: str):
-        """Refresh available models from LM Studio for a specific host."""
-        models = self.get_lm_studio_models(host)
+    def refresh_models_for_host(self, host: str, refresh: bool = True):
+        """Refresh available models from LM Studio for a specific host; an explicit refresh skips the cache."""
+        models = self.get_lm_studio_models(host, refresh)
         return self.ui.refresh_models_display(models)
     
     def update_models_on_host_change(self, provider: str, host: str):
         """Update models when host changes for LM Studio."""
         if provider == "LM Studio (Local)":
-            return self.refresh_models_for_host(host)
+            return self.refresh_models_for_host(host, refresh=False)
         else:
             return gr.Radio()  # No change for other providers
     
@@ -186,22 +481,24 @@ class ArchitectureAnalyzer:
             str: File path or URL to the exported file
         """
         if not self.last_analysis_result:
-            return sanitize_markdown_output("**Error:** No analysis result available to export. Please run an analysis first.")
-        
-        # Get the export format class
-        export_format = next((ef for ef in EXPORT_FORMATS if ef["label"] == format_choice), None)
+            return _trusted("**Error:** No analysis result available to export. Please run an analysis first.")
         
-        if not export_format:
-            return sanitize_markdown_output(f"**Error:** Unknown export format: {format_choice}")
+        if format_choice not in _EXPORT_FORMAT_SET:
+            return _trusted(f"**Error:** Unknown export format: {_escape(format_choice)}")
         
         try:
             # Perform the export
-            file_path = self.export_manager.export_to_format(self.last_analysis_result, export_format["value"])
-            return sanitize_markdown_output(f"✅ Export successful! [Download here]({file_path})")
+            file_path = self.export_manager.export_analysis(
+                analysis_data=self.last_analysis_result["analysis_data"],
+                markdown_plan=self.last_analysis_result["markdown_plan"],
+                model_used=self.last_analysis_result["model_used"],
+                export_format=format_choice
+            )
+            return _trusted(f"✅ Export successful! [Download here]({_escape(file_path)})")
         except Exception as e:
-            return sanitize_markdown_output(f"**Error:** Failed to export analysis result: {str(e)}")
+            return _trusted(f"**Error:** Failed to export analysis result: {_escape(e)}")
     
-    def export_analysis(self, format_choice: str) -> str:
+    async def export_analysis(self, format_choice: str) -> str:
         """
         Export the last analysis result in the specified format.
         
@@ -212,34 +509,39 @@ class ArchitectureAnalyzer:
             Status message with path to the exported file
         """
         if not self.last_analysis_result:
-            return sanitize_markdown_output("⚠️ No analysis results available for export. Please run an analysis first.")
+            return _trusted("⚠️ No analysis results available for export. Please run an analysis first.")
         
         try:
             # Get export format data
-            if format_choice not in EXPORT_FORMATS:
-                return sanitize_markdown_output(f"⚠️ Unsupported export format: {format_choice}. Supported formats: {', '.join(EXPORT_FORMATS)}")
+            if format_choice not in _EXPORT_FORMAT_SET:
+                return _trusted(f"⚠️ Unsupported export format: {_escape(format_choice)}. Supported formats: {', '.join(EXPORT_FORMATS)}")
             
             # Extract data from last analysis
             analysis_data = self.last_analysis_result["analysis_data"]
             markdown_plan = self.last_analysis_result["markdown_plan"]
             model_used = self.last_analysis_result["model_used"]
             
-            # Export to the selected format
-            file_path = self.export_manager.export_analysis(
-                analysis_data=analysis_data,
-                markdown_plan=markdown_plan,
-                model_used=model_used,
-                export_format=format_choice
+            # Export to the selected format on the export pool, keeping the event loop free
+            file_path = await asyncio.get_running_loop().run_in_executor(
+                self._export_pool,
+                functools.partial(
+                    self.export_manager.export_analysis,
+                    analysis_data=analysis_data,
+                    markdown_plan=markdown_plan,
+                    model_used=model_used,
+                    export_format=format_choice
+                )
             )
             
-            # Return a success message with file path
-            if os.path.exists(file_path):
-                return sanitize_markdown_output(f"✅ Analysis exported successfully as {format_choice}!\n\nFile saved to: `{file_path}`")
-            else:
-                return sanitize_markdown_output(f"⚠️ Export completed but file not found at: {file_path}")
+            # The export manager raises on failure, so the returned path exists
+            return _trusted(f"✅ Analysis exported successfully as {_escape(format_choice)}!\n\nFile saved to: `{_escape(file_path)}`")
                 
         except Exception as e:
-            return sanitize_markdown_output(f"⚠️ Export failed: {str(e)}")
+            return _trusted(f"⚠️ Export failed: {_escape(e)}")
+    
+    async def export_and_show(self, format_choice: str) -> gr.HTML:
+        """Export the last analysis result and reveal the status message."""
+        return gr.HTML(value=await self.export_analysis(format_choice), visible=True)
     
     def get_export_preview(self, format_choice: str = "PDF") -> str:
         """
@@ -252,7 +554,13 @@ class ArchitectureAnalyzer:
             HTML content with preview or download link
         """
         if not self.last_analysis_result:
-            return sanitize_markdown_output("⚠️ No analysis results available for preview. Please run an analysis first.")
+            return _trusted("⚠️ No analysis results available for preview. Please run an analysis first.")
+        
+        # Rendering a PDF is expensive, so reuse the preview while the result is unchanged
+        key = (id(self.last_analysis_result), format_choice)
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            return cached
         
         try:
             # Extract data from last analysis
@@ -269,21 +577,16 @@ class ArchitectureAnalyzer:
                 )
                 
                 # Return HTML with embedded PDF preview
-                preview_html = f"""
-                <div style="text-align: center;">
-                    <h3>PDF Preview</h3>
-                    <embed src="data:application/pdf;base64,{base64_pdf}" width="100%" height="600px" type="application/pdf">
-                    <p>If the preview doesn't work, you can export the PDF using the export button.</p>
-                </div>
-                """
+                preview_html = _PDF_PREVIEW_TEMPLATE.format(base64_pdf=base64_pdf)
+                self._preview_cache[key] = preview_html
                 return preview_html
             
             else:
                 # For other formats, just show a message
-                return sanitize_markdown_output(f"Preview not available for {format_choice} format. Use the export button to save the file.")
+                return _trusted(f"Preview not available for {_escape(format_choice)} format. Use the export button to save the file.")
                 
         except Exception as e:
-            return sanitize_markdown_output(f"⚠️ Preview generation failed: {str(e)}")
+            return _trusted(f"⚠️ Preview generation failed: {_escape(e)}")
     
     def create_app(self) -> gr.Blocks:
         """Create the main Gradio application."""
@@ -306,13 +609,15 @@ class ArchitectureAnalyzer:
                     model_selector = self.ui.create_model_selector()
                     
                     # Input section
-                    input_markdown, submit_button = self.ui.create_input_section()
+                    input_markdown, submit_button, compare_button = self.ui.create_input_section()
                 
                 # Output section
                 with gr.Column(scale=1, elem_classes="output-section"):
-                    output_analysis, export_row, export_format, export_button, export_result = self.ui.create_output_section()
+                    output_analysis, export_row, export_format, export_button, export_result = self.ui.create_output_section(include_export=ENABLE_EXPORT)
             
             # Event handlers
+            demo.load(fn=self.prewarm_connections, inputs=None, outputs=None)
+            
             provider_selector.change(
                 fn=self.ui.update_ui_visibility,
                 inputs=provider_selector,
@@ -344,46 +649,62 @@ class ArchitectureAnalyzer:
                 outputs=model_selector
             )
             
-            # Main analysis function
-            submit_button.click(
-                fn=self.analyze_architecture,
-                inputs=[input_markdown, model_selector, provider_selector, lm_studio_host],
-                outputs=output_analysis
-            )
-            
-            # Clear any export preview when new analysis is run
-            submit_button.click(
-                fn=lambda: gr.HTML(value="", visible=False),
-                inputs=[],
-                outputs=export_result
-            )
-            
-            # Export button click handler
-            export_button.click(
-                fn=self.export_analysis,
-                inputs=export_format,
-                outputs=export_result
-            )
+            # Main analysis function; with export enabled, the same event also clears any export preview
+            analysis_inputs = [input_markdown, model_selector, provider_selector, lm_studio_host]
+            if ENABLE_EXPORT:
+                submit_button.click(
+                    fn=self.analyze_and_clear_export,
+                    inputs=analysis_inputs,
+                    outputs=[output_analysis, export_result]
+                )
+            else:
+                submit_button.click(
+                    fn=self.analyze_architecture,
+                    inputs=analysis_inputs,
+                    outputs=output_analysis
+                )
             
-            # Show export result when clicked
-            export_button.click(
-                fn=lambda: gr.HTML(visible=True),
-                inputs=[],
-                outputs=export_result
+            # Side-by-side comparison across providers
+            compare_button.click(
+                fn=self.compare_models,
+                inputs=[input_markdown, lm_studio_host],
+                outputs=output_analysis
             )
             
-            # Hide export result when format changes
-            export_format.change(
-                fn=lambda x: gr.HTML(visible=False),
-                inputs=export_format,
-                outputs=export_result
-            )
+            if ENABLE_EXPORT:
+                self._bind_export_events(export_format, export_button, export_result)
         
         return demo
+    
+    def _bind_export_events(self, export_format: gr.Dropdown, export_button: gr.Button, export_result: gr.HTML) -> None:
+        """Wire up the export controls."""
+        # Export and show the result in a single event
+        export_button.click(
+            fn=self.export_and_show,
+            inputs=export_format,
+            outputs=export_result
+        )
+        
+        # Hide export result when format changes
+        export_format.change(
+            fn=lambda x: gr.HTML(visible=False),
+            inputs=export_format,
+            outputs=export_result
+        )
+
+
+def _install_uvloop() -> None:
+    """Use uvloop for new asyncio event loops when it is installed (it is not available on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 def main():
     """Main entry point for the application."""
+    _install_uvloop()
     app = ArchitectureAnalyzer()
     demo = app.create_app()
     
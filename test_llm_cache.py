@@ -0,0 +1,117 @@
+"""
+Tests for the LLM response and analysis caches.
+"""
+
+import llm_cache
+from core_logic import PlanAnalysisCache
+from llm_cache import LLMCache, SemanticCache
+
+
+class _FakeClock:
+    """Stand-in for time.monotonic that only advances when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_llm_cache_ttl_expiry(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(llm_cache.time, "monotonic", clock)
+    cache = LLMCache(ttl=10.0, max_temperature=0.2)
+    key = cache.cache_key("model", "plan", 0.2)
+    cache.set(key, "response")
+
+    clock.now += 9.0
+    assert cache.get(key) == "response"
+    clock.now += 2.0
+    assert cache.get(key) is None
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+def test_llm_cache_lru_eviction():
+    cache = LLMCache(maxsize=2, max_temperature=0.2)
+    keys = [cache.cache_key("model", f"plan {i}", 0.0) for i in range(3)]
+    cache.set(keys[0], "first")
+    cache.set(keys[1], "second")
+    assert cache.get(keys[0]) == "first"  # Now the most recently used
+
+    cache.set(keys[2], "third")
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == "first"
+    assert cache.get(keys[2]) == "third"
+
+
+def test_llm_cache_key_above_max_temperature():
+    cache = LLMCache(max_temperature=0.2)
+    assert cache.cache_key("model", "plan", 0.2) is not None
+    assert cache.cache_key("model", "plan", 0.7) is None
+    assert cache.cache_key("model", "plan", 0.0) != cache.cache_key("model", "plan", 0.2)
+
+
+def test_llm_cache_set_ignores_none_key_and_empty_response():
+    cache = LLMCache(max_temperature=0.2)
+    key = cache.cache_key("model", "plan", 0.0)
+    cache.set(None, "response")
+    cache.set(key, "")
+    assert cache.get(None) is None
+    assert cache.get(key) is None
+    assert cache._entries == {}
+
+
+SAMPLE_ANALYSIS = {
+    "planSummary": "A web tier in front of a database",
+    "strengths": [],
+    "areasForImprovement": [],
+    "actionableKeyPoints": [],
+}
+
+SAMPLE_PLAN = "We serve 10k users from a postgres primary with two read replicas behind a load balancer. " * 3
+
+
+def test_semantic_cache_exact_match_hit():
+    cache = SemanticCache(max_temperature=0.2)
+    cache.put("model", SAMPLE_PLAN, 0.2, SAMPLE_ANALYSIS)
+    assert cache.get("model", SAMPLE_PLAN, 0.2) is SAMPLE_ANALYSIS
+    assert cache.get("other-model", SAMPLE_PLAN, 0.2) is None
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+def test_semantic_cache_near_duplicates_off_by_default():
+    cache = SemanticCache(max_temperature=0.2)
+    cache.put("model", SAMPLE_PLAN, 0.2, SAMPLE_ANALYSIS)
+    # A changed number is a different plan, however similar the wording
+    assert cache.get("model", SAMPLE_PLAN.replace("10k", "10M"), 0.2) is None
+
+
+def test_semantic_cache_opt_in_near_duplicates_respect_threshold():
+    near_duplicate = SAMPLE_PLAN.replace("10k", "10M")
+    unrelated = "An event sourced ledger on kafka with nightly batch reconciliation jobs."
+
+    cache = SemanticCache(threshold=0.92, max_temperature=0.2)
+    cache.put("model", SAMPLE_PLAN, 0.2, SAMPLE_ANALYSIS)
+    assert cache.get("model", near_duplicate, 0.2, near_duplicates=True) is SAMPLE_ANALYSIS
+    assert cache.get("model", unrelated, 0.2, near_duplicates=True) is None
+
+    strict = PlanAnalysisCache(threshold=1.01)
+    strict.put(SAMPLE_PLAN, SAMPLE_ANALYSIS)
+    assert strict.get(SAMPLE_PLAN) is SAMPLE_ANALYSIS
+    assert strict.get(near_duplicate, near_duplicates=True) is None
+
+
+def test_analysis_cache_model_keys_lm_studio_by_host():
+    from main import _analysis_cache_model
+
+    first = _analysis_cache_model("LM Studio (Local)", "local-model", "localhost:1234")
+    second = _analysis_cache_model("LM Studio (Local)", "local-model", "gpu-box:1234")
+    assert first != second
+    # The host only distinguishes LM Studio servers
+    assert (_analysis_cache_model("Google GenAI", "gemini-2.5-flash", "localhost:1234")
+            == _analysis_cache_model("Google GenAI", "gemini-2.5-flash", "gpu-box:1234"))
+
+    cache = SemanticCache(max_temperature=0.2)
+    cache.put(first, SAMPLE_PLAN, 0.2, SAMPLE_ANALYSIS)
+    assert cache.get(first, SAMPLE_PLAN, 0.2) is SAMPLE_ANALYSIS
+    assert cache.get(second, SAMPLE_PLAN, 0.2) is None
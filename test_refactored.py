@@ -2,138 +2,153 @@
 Test script to verify the refactored application works correctly.
 """
 
+import contextlib
+import importlib
+import importlib.util
+import io
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import get_context
+from typing import Tuple
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Modules the app is built from, with their display names; main depends on the rest
+_LEAF_MODULES = (
+    ("config", "Config"),
+    ("core_logic", "Core logic"),
+    ("llm_clients", "LLM clients"),
+    ("ui_components", "UI components"),
+)
+
 def test_imports():
     """Test that all modules can be imported successfully."""
-    try:
-        import config
-        print("✓ Config module imported successfully")
-        
-        import core_logic
-        print("✓ Core logic module imported successfully")
-        
-        import llm_clients
-        print("✓ LLM clients module imported successfully")
-        
-        import ui_components
-        print("✓ UI components module imported successfully")
-        
-        import main
-        print("✓ Main module imported successfully")
-        
-        return True
-    except Exception as e:
-        print(f"✗ Import error: {e}")
-        return False
+    missing = [name for name, _ in _LEAF_MODULES + (("main", "Main"),) if importlib.util.find_spec(name) is None]
+    if missing:
+        raise ImportError(f"Modules not found: {', '.join(missing)}")
+
+    # The leaves are independent, so their file reads and bytecode loads can overlap
+    with ThreadPoolExecutor(max_workers=len(_LEAF_MODULES)) as executor:
+        list(executor.map(importlib.import_module, [name for name, _ in _LEAF_MODULES]))
+    for _, label in _LEAF_MODULES:
+        print(f"✓ {label} module imported successfully")
+
+    importlib.import_module("main")
+    print("✓ Main module imported successfully")
 
 def test_core_logic():
     """Test core logic functions."""
-    try:
-        from core_logic import validate_input, EXAMPLE_PLAN, ARCHITECT_SYSTEM_PROMPT
-        
-        # Test input validation
-        assert validate_input("# Test plan") == True
-        assert validate_input("") == False
-        assert validate_input("   ") == False
-        print("✓ Input validation works correctly")
-        
-        # Test example plan exists
-        assert EXAMPLE_PLAN and len(EXAMPLE_PLAN) > 0
-        print("✓ Example plan is available")
-        
-        # Test system prompt exists
-        assert ARCHITECT_SYSTEM_PROMPT and len(ARCHITECT_SYSTEM_PROMPT) > 0
-        print("✓ System prompt is available")
-        
-        return True
-    except Exception as e:
-        print(f"✗ Core logic test error: {e}")
-        return False
+    from core_logic import validate_input, EXAMPLE_PLAN, ARCHITECT_SYSTEM_PROMPT
+
+    # Test input validation
+    assert validate_input("# Test plan") == True
+    assert validate_input("") == False
+    assert validate_input("   ") == False
+    print("✓ Input validation works correctly")
+
+    # Test example plan exists
+    assert EXAMPLE_PLAN and len(EXAMPLE_PLAN) > 0
+    print("✓ Example plan is available")
+
+    # Test system prompt exists
+    assert ARCHITECT_SYSTEM_PROMPT and len(ARCHITECT_SYSTEM_PROMPT) > 0
+    print("✓ System prompt is available")
 
 def test_llm_clients():
     """Test LLM client creation."""
-    try:
-        from llm_clients import LLMClientFactory
-        
-        # Test Google client creation
-        google_client = LLMClientFactory.create_google_client()
-        print("✓ Google client created successfully")
-        
-        # Test LM Studio client creation
-        lm_studio_client = LLMClientFactory.create_lm_studio_client()
-        print("✓ LM Studio client created successfully")
-        
-        return True
-    except Exception as e:
-        print(f"✗ LLM clients test error: {e}")
-        return False
+    from llm_clients import google_client, lm_studio_client
+
+    # Test Google client creation
+    assert google_client() is google_client()
+    print("✓ Google client created successfully")
+
+    # Test LM Studio client creation
+    assert lm_studio_client() is lm_studio_client()
+    print("✓ LM Studio client created successfully")
 
 def test_ui_components():
     """Test UI components creation."""
-    try:
-        from ui_components import UIComponents, create_gradio_interface
-        
-        # Test UI components creation
-        ui = UIComponents()
-        print("✓ UI components created successfully")
-        
-        # Test Gradio interface creation
-        interface = create_gradio_interface()
-        print("✓ Gradio interface created successfully")
-        
-        return True
-    except Exception as e:
-        print(f"✗ UI components test error: {e}")
-        return False
+    from ui_components import UIComponents, create_gradio_interface
+
+    # Test UI components creation
+    ui = UIComponents()
+    print("✓ UI components created successfully")
+
+    # Test Gradio interface creation
+    interface = create_gradio_interface()
+    print("✓ Gradio interface created successfully")
 
 def test_main_app():
     """Test main application creation."""
-    try:
-        from main import ArchitectureAnalyzer
-        
-        # Test application creation
-        app = ArchitectureAnalyzer()
-        print("✓ Architecture analyzer created successfully")
-        
-        return True
-    except Exception as e:
-        print(f"✗ Main app test error: {e}")
-        return False
-
-def main():
-    """Run all tests."""
-    print("🧪 Running refactored application tests...\n")
+    from main import ArchitectureAnalyzer
+
+    # Test application creation
+    app = ArchitectureAnalyzer()
+    print("✓ Architecture analyzer created successfully")
+
+# Each test raises on failure; main() runs them in order and tallies the results
+TESTS = [
+    ("Import Tests", test_imports),
+    ("Core Logic Tests", test_core_logic),
+    ("LLM Clients Tests", test_llm_clients),
+    ("UI Components Tests", test_ui_components),
+    ("Main Application Tests", test_main_app)
+]
+
+def _run_one(index: int) -> Tuple[str, bool, str]:
+    """Run one entry of TESTS, returning its name, whether it passed and its captured output."""
+    test_name, test_func = TESTS[index]
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        try:
+            test_func()
+            passed = True
+        except Exception as e:
+            print(f"✗ {test_name} error: {e}")
+            print(f"❌ {test_name} failed")
+            passed = False
+    return test_name, passed, log.getvalue()
+
+def main(parallel: bool = False):
+    """
+    Run all tests.
     
-    tests = [
-        ("Import Tests", test_imports),
-        ("Core Logic Tests", test_core_logic),
-        ("LLM Clients Tests", test_llm_clients),
-        ("UI Components Tests", test_ui_components),
-        ("Main Application Tests", test_main_app)
-    ]
+    Args:
+        parallel: Run each test in its own spawned interpreter, so their
+            heavy imports proceed side by side instead of one after another
+    """
+    # Output is collected and written in one go; a failure flushes what came before it
+    out = io.StringIO()
+    out.write("🧪 Running refactored application tests...\n\n")
     
     passed = 0
-    total = len(tests)
+    total = len(TESTS)
     
-    for test_name, test_func in tests:
-        print(f"\n📋 {test_name}:")
-        if test_func():
-            passed += 1
-        else:
-            print(f"❌ {test_name} failed")
+    if parallel:
+        with get_context("spawn").Pool(total) as pool:
+            results = pool.map(_run_one, range(total))
+    else:
+        results = map(_run_one, range(total))
     
-    print(f"\n🎯 Test Results: {passed}/{total} tests passed")
+    for test_name, test_passed, log in results:
+        out.write(f"\n📋 {test_name}:\n{log}")
+        passed += test_passed
+        if not test_passed:
+            sys.stdout.write(out.getvalue())
+            sys.stdout.flush()
+            out = io.StringIO()
+    
+    out.write(f"\n🎯 Test Results: {passed}/{total} tests passed\n")
     
     if passed == total:
-        print("🎉 All tests passed! The refactored application is working correctly.")
-        print("\n▶️  To run the application, use: python main.py")
+        out.write("🎉 All tests passed! The refactored application is working correctly.\n")
+        out.write("\n▶️  To run the application, use: python main.py\n")
     else:
-        print("❌ Some tests failed. Please check the errors above.")
+        out.write("❌ Some tests failed. Please check the errors above.\n")
+    
+    sys.stdout.write(out.getvalue())
 
 if __name__ == "__main__":
-    main()
+    main(parallel="--parallel" in sys.argv[1:])
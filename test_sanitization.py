@@ -3,14 +3,60 @@
 Test script to verify that the markdown sanitization function works correctly.
 """
 
-import bleach
+import functools
+import sys
+from typing import Any
 
+try:
+    import nh3
+except ImportError:  # Fall back to bleach
+    nh3 = None
+
+# Allowed HTML tags for markdown formatting
+_ALLOWED_TAGS = frozenset({
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',  # Headers
+    'p', 'br', 'hr',                       # Paragraphs and breaks
+    'strong', 'b', 'em', 'i', 'u', 's',   # Text formatting
+    'ul', 'ol', 'li',                      # Lists
+    'blockquote', 'pre', 'code',           # Code and quotes
+    'table', 'thead', 'tbody', 'tr', 'th', 'td',  # Tables
+    'a',                                   # Links (with limited attributes)
+})
+
+# Allowed attributes for specific tags
+_ALLOWED_ATTRIBUTES = {
+    'a': frozenset({'href', 'title'}),
+    'code': frozenset({'class'}),  # For syntax highlighting
+    'pre': frozenset({'class'}),   # For code blocks
+}
+
+@functools.cache
+def _load_cleaner() -> Any:
+    """
+    Import bleach and build its Cleaner on first use, keeping html5lib out of test collection.
+    
+    Built once: constructing a Cleaner sets up its html5lib parser and filters.
+    Linkifying runs as a filter in the same pass, adding rel="nofollow" to links.
+    """
+    import bleach
+    from bleach.linkifier import LinkifyFilter
+    from bleach.sanitizer import Cleaner
+    
+    return Cleaner(
+        tags=_ALLOWED_TAGS,
+        attributes=_ALLOWED_ATTRIBUTES,
+        strip=True,  # Remove disallowed tags completely
+        filters=[functools.partial(LinkifyFilter, callbacks=[bleach.callbacks.nofollow])]
+    )
+
+@functools.lru_cache(maxsize=256)
 def sanitize_markdown_output(content: str) -> str:
     """
     Sanitize markdown content to prevent XSS attacks.
     
     This function removes potentially dangerous HTML tags and attributes
-    while preserving safe markdown formatting.
+    while preserving safe markdown formatting. Results are memoized, so
+    content must be a (hashable) str and repeated content is parsed once.
     
     Args:
         content (str): The raw markdown content from LLM
@@ -18,87 +64,63 @@ def sanitize_markdown_output(content: str) -> str:
     Returns:
         str: Sanitized markdown content safe for rendering
     """
-    # Define allowed HTML tags for markdown formatting
-    allowed_tags = [
-        'h1', 'h2', 'h3', 'h4', 'h5', 'h6',  # Headers
-        'p', 'br', 'hr',                       # Paragraphs and breaks
-        'strong', 'b', 'em', 'i', 'u', 's',   # Text formatting
-        'ul', 'ol', 'li',                      # Lists
-        'blockquote', 'pre', 'code',           # Code and quotes
-        'table', 'thead', 'tbody', 'tr', 'th', 'td',  # Tables
-        'a',                                   # Links (with limited attributes)
-    ]
-    
-    # Define allowed attributes for specific tags
-    allowed_attributes = {
-        'a': ['href', 'title'],
-        'code': ['class'],  # For syntax highlighting
-        'pre': ['class'],   # For code blocks
-    }
+    # Markup can only start at '<': without one there is nothing to strip, and
+    # skipping the parse keeps markdown verbatim (linkify would otherwise rewrite
+    # the URL inside [text](url) and entity-encode '&' and '>')
+    if "<" not in content:
+        return content
     
-    # Sanitize the content
-    cleaned_content = bleach.clean(
-        content,
-        tags=allowed_tags,
-        attributes=allowed_attributes,
-        strip=True  # Remove disallowed tags completely
-    )
+    # nh3 sanitizes in Rust without building a tree of Python node objects,
+    # adding rel="nofollow" to links as it goes
+    if nh3 is not None:
+        return nh3.clean(content, tags=_ALLOWED_TAGS, attributes=_ALLOWED_ATTRIBUTES, link_rel="nofollow")
     
-    # Additional protection: ensure URLs in links are safe
-    cleaned_content = bleach.linkify(
-        cleaned_content,
-        callbacks=[bleach.callbacks.nofollow]  # Add rel="nofollow" to external links
-    )
-    
-    return cleaned_content
+    # Sanitize the content and make links safe in a single parse
+    return _load_cleaner().clean(content)
 
 def test_sanitization():
     """Test the sanitization function with various potentially malicious inputs."""
     
-    print("Testing Markdown Sanitization...")
-    print("=" * 50)
+    # Collected and written once at the end instead of one print per line
+    out = ["Testing Markdown Sanitization...", "=" * 50]
+    try:
+        _run_sanitization_cases(out)
+        out.append("✅ Sanitization test completed!")
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
+def _run_sanitization_cases(out: list) -> None:
+    """Run each sanitization case, appending its report to out."""
     
     # Test 1: Normal markdown should pass through
     normal_md = "## Test Header\n**Bold text** and *italic text*\n- List item\n"
     result1 = sanitize_markdown_output(normal_md)
-    print("Test 1 - Normal Markdown:")
-    print(f"Input:  {repr(normal_md)}")
-    print(f"Output: {repr(result1)}")
-    print()
+    out.append(f"Test 1 - Normal Markdown:\nInput:  {normal_md!r}\nOutput: {result1!r}\n")
+    assert result1 == normal_md
     
     # Test 2: Script tag should be removed
     malicious_md = "## Heading\n<script>alert('XSS')</script>\nNormal text"
     result2 = sanitize_markdown_output(malicious_md)
-    print("Test 2 - Script Tag (should be removed):")
-    print(f"Input:  {repr(malicious_md)}")
-    print(f"Output: {repr(result2)}")
-    print()
+    out.append(f"Test 2 - Script Tag (should be removed):\nInput:  {malicious_md!r}\nOutput: {result2!r}\n")
+    assert "<script" not in result2
     
     # Test 3: Onclick handler should be removed
     onclick_md = "## Heading\n<a href='#' onclick='alert(\"XSS\")'>Click me</a>"
     result3 = sanitize_markdown_output(onclick_md)
-    print("Test 3 - Onclick Handler (should be removed):")
-    print(f"Input:  {repr(onclick_md)}")
-    print(f"Output: {repr(result3)}")
-    print()
+    out.append(f"Test 3 - Onclick Handler (should be removed):\nInput:  {onclick_md!r}\nOutput: {result3!r}\n")
+    assert "onclick" not in result3
     
     # Test 4: Safe link should be preserved
     safe_link_md = "## Heading\n[Safe Link](https://example.com)"
     result4 = sanitize_markdown_output(safe_link_md)
-    print("Test 4 - Safe Link (should be preserved):")
-    print(f"Input:  {repr(safe_link_md)}")
-    print(f"Output: {repr(result4)}")
-    print()
+    out.append(f"Test 4 - Safe Link (should be preserved):\nInput:  {safe_link_md!r}\nOutput: {result4!r}\n")
+    assert result4 == safe_link_md
     
     # Test 5: iframe should be removed
     iframe_md = "## Heading\n<iframe src='javascript:alert(\"XSS\")'></iframe>"
     result5 = sanitize_markdown_output(iframe_md)
-    print("Test 5 - iframe (should be removed):")
-    print(f"Input:  {repr(iframe_md)}")
-    print(f"Output: {repr(result5)}")
-    print()
-    
-    print("✅ Sanitization test completed!")
+    out.append(f"Test 5 - iframe (should be removed):\nInput:  {iframe_md!r}\nOutput: {result5!r}\n")
+    assert "<iframe" not in result5 and "javascript:" not in result5
 
 if __name__ == "__main__":
     test_sanitization()
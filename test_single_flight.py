@@ -0,0 +1,85 @@
+"""
+Tests for the single-flight coalescing of identical analyses in _alpha.py.
+"""
+
+import asyncio
+import json
+
+import _alpha
+
+LM_STUDIO = "LM Studio (Local)"
+
+SAMPLE_RESPONSE = json.dumps({
+    "planSummary": "A shared summary",
+    "strengths": [{"point": "Stateless", "reason": "Scales out"}],
+    "areasForImprovement": [],
+    "actionableKeyPoints": ["Add a cache"],
+})
+
+
+def _gated_stream(release: asyncio.Event, calls: list):
+    """Build a fake provider stream that stalls until ``release`` is set."""
+    async def stream(markdown_plan, model_choice, host=_alpha.DEFAULT_LM_STUDIO_HOST):
+        calls.append(markdown_plan)
+        yield SAMPLE_RESPONSE[:10]
+        await release.wait()
+        yield SAMPLE_RESPONSE[10:]
+    return stream
+
+
+async def _collect(gen) -> list:
+    return [output async for output in gen]
+
+
+def test_follower_receives_leader_result(monkeypatch):
+    """A concurrent identical request awaits the leader's call instead of making its own."""
+    async def scenario():
+        release = asyncio.Event()
+        calls: list = []
+        monkeypatch.setattr(_alpha, "call_lm_studio_stream", _gated_stream(release, calls))
+        plan = "single-flight plan: leader completes"
+
+        leader = asyncio.create_task(_collect(_alpha.analyze_architecture(plan, "m", LM_STUDIO)))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(_collect(_alpha.analyze_architecture(plan, "m", LM_STUDIO)))
+        await asyncio.sleep(0.01)
+        assert len(_alpha._INFLIGHT) == 1
+
+        release.set()
+        leader_out, follower_out = await asyncio.gather(leader, follower)
+        return calls, leader_out, follower_out
+
+    calls, leader_out, follower_out = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert "A shared summary" in leader_out[-1]
+    assert "A shared summary" in follower_out[-1]
+    assert _alpha._INFLIGHT == {}
+
+
+def test_follower_gets_error_when_leader_closed(monkeypatch):
+    """Closing the leader mid-stream fails followers with an error message, not CancelledError."""
+    async def scenario():
+        release = asyncio.Event()
+        calls: list = []
+        monkeypatch.setattr(_alpha, "call_lm_studio_stream", _gated_stream(release, calls))
+        plan = "single-flight plan: leader closed"
+
+        leader = _alpha.analyze_architecture(plan, "m", LM_STUDIO)
+        await leader.__anext__()  # Loading message
+        pending = asyncio.ensure_future(leader.__anext__())  # Leader now waits inside the stream
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(_collect(_alpha.analyze_architecture(plan, "m", LM_STUDIO)))
+        await asyncio.sleep(0.01)
+
+        pending.cancel()
+        try:
+            await pending
+        except asyncio.CancelledError:
+            pass
+        await leader.aclose()
+        return calls, await follower
+
+    calls, follower_out = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert "cancelled" in follower_out[-1]
+    assert _alpha._INFLIGHT == {}
@@ -2,11 +2,23 @@
 Gradio UI components and styling for VelocityAI - A Systems Architect Toolset.
 """
 
-import gradio as gr
-from typing import List, Tuple
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from config import GEMINI_FLASH, GEMINI_PRO, DEFAULT_LM_STUDIO_HOST
-from core_logic import EXAMPLE_PLAN
+from core_logic import example_plan
+
+if TYPE_CHECKING:
+    import gradio as gr
+
+
+@functools.cache
+def _gr() -> Any:
+    """Import Gradio on first use; it is slow to import and not needed until the UI is built."""
+    import gradio
+    return gradio
 
 
 # Custom CSS for full-page layout
@@ -105,6 +117,38 @@ footer {
 """
 
 
+# Model selector updates that do not depend on the event, built once
+_GOOGLE_RADIO_KWARGS = {
+    "choices": (GEMINI_FLASH, GEMINI_PRO),
+    "value": GEMINI_PRO,
+    "label": "🔧 Select Model",
+    "info": "Pro is more thorough but slower; Flash is faster.",
+}
+_LM_STUDIO_RADIO_KWARGS = {
+    "label": "🔧 Select Model",
+    "info": "Local models from LM Studio. Make sure LM Studio is running.",
+}
+_NO_MODELS_RADIO_KWARGS = {
+    "choices": ("local-model",),
+    "value": "local-model",
+    "label": "🔧 Select Model",
+    "info": "No models found. Please check your LM Studio connection.",
+}
+
+# Kind of model selector -> builder of its Radio keyword arguments from the model list
+_RADIO_BUILDERS: Dict[str, Callable[[Sequence[str]], Dict[str, Any]]] = {
+    "google": lambda models: _GOOGLE_RADIO_KWARGS,
+    "lm_live": lambda models: {"choices": models, "value": models[0] if models else "local-model",
+                               **_LM_STUDIO_RADIO_KWARGS},
+    "lm_empty": lambda models: _NO_MODELS_RADIO_KWARGS,
+}
+
+
+def _make_radio(kind: str, models: Sequence[str] = (), **extra: Any) -> gr.Radio:
+    """Build the model selector Radio of the given kind ("google", "lm_live" or "lm_empty")."""
+    return _gr().Radio(**_RADIO_BUILDERS[kind](models), **extra)
+
+
 class UIComponents:
     """Container for UI components and their event handlers."""
     
@@ -115,6 +159,7 @@ class UIComponents:
         
     def create_header(self) -> gr.Column:
         """Create the main header section."""
+        gr = _gr()
         with gr.Column(elem_classes="main-header") as header:
             gr.Markdown("# 🚀 VelocityAI - A Systems Architect Toolset")
             gr.Markdown("Enter your system architecture plan in Markdown. The AI will analyze it for scalability, reliability, security, and more.")
@@ -122,6 +167,7 @@ class UIComponents:
     
     def create_export_section(self) -> Tuple[gr.Row, gr.Dropdown, gr.Button, gr.HTML]:
         """Create export controls section."""
+        gr = _gr()
         with gr.Row(elem_classes="export-section") as export_row:
             export_format = gr.Dropdown(
                 choices=["PDF", "HTML", "Markdown"],
@@ -146,6 +192,7 @@ class UIComponents:
         
     def create_provider_selector(self) -> gr.Radio:
         """Create the provider selection radio buttons."""
+        gr = _gr()
         return gr.Radio(
             ["Google GenAI", "LM Studio (Local)"],
             label="🔌 Inference Provider",
@@ -156,6 +203,7 @@ class UIComponents:
     
     def create_lm_studio_config(self) -> Tuple[gr.Column, gr.Textbox, gr.Button, gr.Markdown, gr.Button]:
         """Create the LM Studio configuration section."""
+        gr = _gr()
         with gr.Column(visible=False) as lm_studio_config:
             gr.Markdown("### 🔧 LM Studio Configuration")
             
@@ -188,20 +236,15 @@ class UIComponents:
     
     def create_model_selector(self) -> gr.Radio:
         """Create the model selection radio buttons."""
-        return gr.Radio(
-            [GEMINI_FLASH, GEMINI_PRO],
-            label="🔧 Select Model",
-            value=GEMINI_PRO,
-            info="Pro is more thorough but slower; Flash is faster.",
-            elem_classes="model-selector"
-        )
+        return _make_radio("google", elem_classes="model-selector")
     
-    def create_input_section(self) -> Tuple[gr.Code, gr.Button]:
-        """Create the input section with markdown editor and submit button."""
+    def create_input_section(self) -> Tuple[gr.Code, gr.Button, gr.Button]:
+        """Create the input section with markdown editor, submit and compare buttons."""
+        gr = _gr()
         input_markdown = gr.Code(
             label="📋 Architecture Plan (Markdown)", 
             language="markdown",
-            value=EXAMPLE_PLAN, 
+            value=example_plan(), 
             lines=30,
             max_lines=50
         )
@@ -212,10 +255,16 @@ class UIComponents:
             elem_classes="analyze-button"
         )
         
-        return input_markdown, submit_button
+        compare_button = gr.Button(
+            "⚖️ Compare Models",
+            variant="secondary"
+        )
+        
+        return input_markdown, submit_button, compare_button
     
-    def create_output_section(self) -> Tuple[gr.Markdown, gr.Row, gr.Dropdown, gr.Button, gr.HTML]:
-        """Create the output section for displaying results."""
+    def create_output_section(self, include_export: bool = True) -> Tuple[gr.Markdown, Optional[gr.Row], Optional[gr.Dropdown], Optional[gr.Button], Optional[gr.HTML]]:
+        """Create the output section for displaying results, with export controls unless disabled."""
+        gr = _gr()
         gr.Markdown("## 📊 Analysis Results")
         
         analysis_output = gr.Markdown(
@@ -224,6 +273,9 @@ class UIComponents:
             elem_id="output-analysis"
         )
         
+        if not include_export:
+            return analysis_output, None, None, None, None
+        
         # Add export controls
         export_row, export_format, export_button, export_result = self.create_export_section()
         
@@ -231,44 +283,20 @@ class UIComponents:
     
     def update_model_choices(self, provider: str, lm_studio_models: List[str]) -> gr.Radio:
         """Update model choices based on provider selection."""
-        if provider == "Google GenAI":
-            return gr.Radio(
-                choices=[GEMINI_FLASH, GEMINI_PRO],
-                value=GEMINI_PRO,
-                label="🔧 Select Model",
-                info="Pro is more thorough but slower; Flash is faster."
-            )
-        else:  # LM Studio
-            return gr.Radio(
-                choices=lm_studio_models,
-                value=lm_studio_models[0] if lm_studio_models else "local-model",
-                label="🔧 Select Model",
-                info="Local models from LM Studio. Make sure LM Studio is running."
-            )
+        return _make_radio("google" if provider == "Google GenAI" else "lm_live", lm_studio_models)
     
     def update_ui_visibility(self, provider: str) -> gr.Column:
         """Update UI visibility based on provider selection."""
+        gr = _gr()
         show_lm_config = provider == "LM Studio (Local)"
         return gr.Column(visible=show_lm_config)
     
     def refresh_models_display(self, models: List[str]) -> gr.Radio:
         """Refresh the model display with new models."""
-        if models and models != ["local-model"]:
-            return gr.Radio(
-                choices=models,
-                value=models[0],
-                label="🔧 Select Model",
-                info="Local models from LM Studio. Make sure LM Studio is running."
-            )
-        else:
-            return gr.Radio(
-                choices=["local-model"],
-                value="local-model",
-                label="🔧 Select Model",
-                info="No models found. Please check your LM Studio connection."
-            )
+        return _make_radio("lm_live" if models and models != ["local-model"] else "lm_empty", models)
 
 
 def create_gradio_interface() -> gr.Blocks:
     """Create the main Gradio interface."""
+    gr = _gr()
     return gr.Blocks(css=CUSTOM_CSS, title="VelocityAI - A Systems Architect Toolset")